@@ -1,6 +1,7 @@
 """Django admin configuration for ISCC Hub models."""
 
 import json
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -13,6 +14,15 @@ from unfold.admin import ModelAdmin
 from iscc_hub.models import Event, IsccDeclaration
 
 
+@lru_cache(maxsize=4096)
+def _iscc_id_to_iso(iscc_id):
+    # type: (str) -> str
+    """Decode the ISCC-ID timestamp as ISO string (cached, list pages render the same IDs repeatedly)."""
+    from iscc_hub.iscc_id import IsccID
+
+    return IsccID(iscc_id).timestamp_iso
+
+
 @admin.register(IsccDeclaration)
 class IsccDeclarationAdmin(ModelAdmin):
     """Admin interface for IsccDeclaration model."""
@@ -120,10 +130,7 @@ class IsccDeclarationAdmin(ModelAdmin):
         # type: (IsccDeclaration) -> str
         """Extract creation timestamp from ISCC-ID."""
         if obj.iscc_id:
-            from iscc_hub.iscc_id import IsccID
-
-            iscc_obj = IsccID(obj.iscc_id)
-            return iscc_obj.timestamp_iso
+            return _iscc_id_to_iso(obj.iscc_id)
         return "—"
 
     creation_time.short_description = "Declaration Time"
@@ -255,10 +262,7 @@ class EventAdmin(ModelAdmin):
         # type: (Event) -> str
         """Extract initial declaration timestamp from ISCC-ID."""
         if obj.iscc_id:
-            from iscc_hub.iscc_id import IsccID
-
-            iscc_obj = IsccID(obj.iscc_id)
-            return iscc_obj.timestamp_iso
+            return _iscc_id_to_iso(obj.iscc_id)
         return "—"
 
     iscc_id_timestamp.short_description = "Declaration Time (ISCC-ID)"
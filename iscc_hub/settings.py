@@ -34,6 +34,7 @@ ISCC_HUB_ID = env.int("ISCC_HUB_ID", default=0 if DEV else env.NOTSET)
 # Database file name - defaults based on DEBUG setting
 # Development: iscc-hub-dev.db
 # Production: iscc-hub-{ID}.db where ID is the hub ID
+# Use ":memory:" for a throwaway in-memory database (e.g. fixture generation)
 default_db_name = "iscc-hub-dev.db" if DEV else f"iscc-hub-{ISCC_HUB_ID:04d}.db"
 ISCC_HUB_DB_NAME = env("ISCC_HUB_DB_NAME", default=default_db_name)
 
@@ -99,7 +100,7 @@ WSGI_APPLICATION = "iscc_hub.wsgi.application"
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": DATA_DIR / ISCC_HUB_DB_NAME,
+        "NAME": ISCC_HUB_DB_NAME if ISCC_HUB_DB_NAME == ":memory:" else DATA_DIR / ISCC_HUB_DB_NAME,
         "OPTIONS": {
             "transaction_mode": "IMMEDIATE",  # Required for gapless sequences !!!
             "init_command": ("PRAGMA journal_mode=WAL;PRAGMA synchronous=FULL;PRAGMA busy_timeout=5000;"),
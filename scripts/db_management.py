@@ -5,9 +5,14 @@ Database management commands for development.
 This script provides:
 - init: Initialize database if it doesn't exist (skips if already exists)
 - reset: Force reset database (deletes existing and recreates)
+
+After a full rebuild, reset saves a binary snapshot next to the database and restores it on the next
+reset as long as none of the files that shape the database (see SNAPSHOT_SOURCES) changed.
 """
 
 import os
+import shutil
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -31,6 +36,18 @@ from django.contrib.auth import get_user_model  # noqa: E402
 from django.core.management import call_command  # noqa: E402
 from django.db import connection  # noqa: E402
 
+BASE_DIR = Path(__file__).resolve().parent.parent
+MIGRATIONS_DIR = BASE_DIR / "iscc_hub" / "migrations"
+FIXTURES_FILE = BASE_DIR / "iscc_hub" / "fixtures" / "test_data.json"
+
+# Files whose changes invalidate the database snapshot, migrations are added on each check
+SNAPSHOT_SOURCES = (
+    FIXTURES_FILE,
+    BASE_DIR / "iscc_hub" / "models.py",
+    BASE_DIR / "iscc_hub" / "settings.py",
+    Path(__file__).resolve(),
+)
+
 
 def delete_database(db_path):
     # type: (Path) -> bool
@@ -40,93 +57,115 @@ def delete_database(db_path):
     :param db_path: Path to the database file
     :return: True if database was deleted, False otherwise
     """
-    if db_path.exists():
-        print("  ✓ Deleting existing database...")
-        try:
-            # Close any existing connections
-            connection.close()
-            db_path.unlink()
-            print(f"    Database deleted: {db_path}")
-            return True
-        except PermissionError:
-            print("    ⚠️  Could not delete database (may be in use). Continuing...")
-            return False
-    return False
-
-
-def ensure_migrations():
-    # type: () -> bool
-    """
-    Ensure migrations exist, creating them if necessary.
-
-    :return: True if migrations were created, False if they already existed
-    """
-    migrations_dir = Path("iscc_hub/migrations")
-    has_migrations = migrations_dir.exists() and any(
-        f.name.startswith("0001_") for f in migrations_dir.glob("*.py")
-    )
-
-    if not has_migrations:
-        print("  ✓ Creating migrations...")
-        call_command("makemigrations", "iscc_hub", verbosity=0)
-        print("    Migrations created")
-        return True
-    else:
-        print("  ℹ️  Using existing migrations")
+    # Close any existing connections
+    connection.close()
+    try:
+        db_path.unlink()
+    except FileNotFoundError:
+        print("  ℹ️  No existing database found")
+        return False
+    except PermissionError:
+        print("    ⚠️  Could not delete database (may be in use). Continuing...")
         return False
+    print(f"  ✓ Deleted existing database: {db_path}")
+    return True
 
 
 def apply_migrations():
     # type: () -> None
     """Apply database migrations."""
+    if not any(MIGRATIONS_DIR.glob("0001_*.py")):
+        raise RuntimeError(f"No initial migration found in {MIGRATIONS_DIR}")
     print("  ✓ Applying migrations...")
     call_command("migrate", verbosity=0)
     print("    Migrations applied")
 
 
+def tune_connection():
+    # type: () -> None
+    """
+    Disable SQLite durability for the bulk writes of this script.
+
+    The dev database is regenerated on every reset, so losing it on a crash is harmless.
+    WAL mode is kept as the app expects it; the other pragmas only apply to the current connection.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+
+
 def create_superuser():
     # type: () -> None
     """Create demo superuser account if it doesn't exist."""
     print("  ✓ Creating demo superuser...")
     User = get_user_model()
 
-    if not User.objects.filter(username="demo").exists():
+    # Check first so the deliberately slow password hashing only runs for a new user
+    if User.objects.filter(username="demo").exists():
+        print("    Superuser 'demo' already exists")
+    else:
         User.objects.create_superuser(username="demo", email="demo@example.com", password="demo")
         print("    Created superuser: demo/demo")
-    else:
-        print("    Superuser 'demo' already exists")
 
 
 def load_fixtures():
     # type: () -> None
     """Load test fixture data if available."""
-    fixtures_file = Path("iscc_hub/fixtures/test_data.json")
-    if fixtures_file.exists():
+    if FIXTURES_FILE.exists():
         print("  ✓ Loading test fixtures...")
-        call_command("loaddata", "test_data", verbosity=0)
-        print(f"    Loaded fixtures from {fixtures_file}")
+        call_command("loaddata", FIXTURES_FILE, verbosity=0)
+        print(f"    Loaded fixtures from {FIXTURES_FILE}")
     else:
-        print(f"  ⚠️  No fixtures found at {fixtures_file}")
+        print(f"  ⚠️  No fixtures found at {FIXTURES_FILE}")
         print("     Run 'uv run poe fixtures-generate' to create fixtures")
 
 
-def cleanup_migrations(migrations_dir):
+def snapshot_path(db_path):
+    # type: (Path) -> Path
+    """Return the path of the binary snapshot for a database file."""
+    return db_path.with_name(db_path.name + ".snapshot")
+
+
+def save_snapshot(db_path):
     # type: (Path) -> None
     """
-    Clean up temporary migrations directory.
+    Save a binary copy of the freshly populated database for fast resets.
 
-    :param migrations_dir: Path to migrations directory
+    Uses the SQLite backup API so pending WAL content is included.
+
+    :param db_path: Path to the database file
+    """
+    connection.ensure_connection()
+    target = sqlite3.connect(snapshot_path(db_path))
+    try:
+        connection.connection.backup(target)
+    finally:
+        target.close()
+    print(f"  ✓ Saved database snapshot: {snapshot_path(db_path)}")
+
+
+def restore_snapshot(db_path):
+    # type: (Path) -> bool
     """
-    if migrations_dir.exists():
-        print("  ✓ Cleaning up temporary migrations...")
-        try:
-            import shutil
+    Restore the database from its snapshot if it is newer than all snapshot sources and migrations.
 
-            shutil.rmtree(migrations_dir)
-            print("    Migrations cleaned up")
-        except Exception as e:
-            print(f"    ⚠️  Could not clean up migrations: {e}")
-            print("    You may need to manually delete iscc_hub/migrations/")
+    :param db_path: Path to the (deleted) database file
+    :return: True if the snapshot was restored, False if it is missing or stale
+    """
+    snapshot = snapshot_path(db_path)
+    try:
+        snapshot_mtime = snapshot.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    sources = [*SNAPSHOT_SOURCES, *MIGRATIONS_DIR.glob("*.py")]
+    if any(source.stat().st_mtime >= snapshot_mtime for source in sources if source.exists()):
+        print("  ℹ️  Database snapshot is stale, rebuilding")
+        return False
+    shutil.copyfile(snapshot, db_path)
+    print(f"  ✓ Restored database snapshot: {snapshot}")
+    return True
 
 
 def print_summary():
@@ -134,13 +173,17 @@ def print_summary():
     """Print database summary and usage instructions."""
     print("\n📊 Database summary:")
 
-    # Import models here to avoid issues if migrations don't exist yet
-    from iscc_hub.models import Event, IsccDeclaration
-
-    event_count = Event.objects.count()
-    declaration_count = IsccDeclaration.objects.count()
-    active_count = IsccDeclaration.objects.filter(deleted=False).count()
-    deleted_count = IsccDeclaration.objects.filter(deleted=True).count()
+    # Count everything in one raw query, no ORM or model import needed
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM iscc_event),
+                COUNT(*),
+                COALESCE(SUM(deleted = 0), 0),
+                COALESCE(SUM(deleted = 1), 0)
+            FROM iscc_declaration
+        """)
+        event_count, declaration_count, active_count, deleted_count = cursor.fetchone()
 
     print(f"  - Events: {event_count}")
     print(f"  - Declarations: {declaration_count}")
@@ -171,11 +214,9 @@ def init_database():
 
     print(f"🔄 Initializing development database: {db_path}")
 
-    # Track if we created migrations (for cleanup later)
-    created_migrations = ensure_migrations()
-
     # Apply migrations
     apply_migrations()
+    tune_connection()
 
     # Create superuser
     create_superuser()
@@ -183,11 +224,6 @@ def init_database():
     # Load test fixtures
     load_fixtures()
 
-    # Clean up migrations if we created them
-    if created_migrations:
-        migrations_dir = Path("iscc_hub/migrations")
-        cleanup_migrations(migrations_dir)
-
     print("\n✅ Database initialization complete!")
     print_summary()
 
@@ -206,27 +242,25 @@ def reset_database():
     print(f"🔄 Resetting development database: {db_path}")
 
     # Delete existing database if it exists
-    if db_path.exists():
-        delete_database(db_path)
-    else:
-        print("  ℹ️  No existing database found")
+    delete_database(db_path)
 
-    # Track if we created migrations (for cleanup later)
-    created_migrations = ensure_migrations()
+    # A database that could not be deleted (e.g. still locked) is neither replaced by nor saved as a snapshot
+    fresh = not db_path.exists()
 
-    # Apply migrations
-    apply_migrations()
+    # Skip the rebuild when an up-to-date snapshot exists
+    if not (fresh and restore_snapshot(db_path)):
+        # Apply migrations
+        apply_migrations()
+        tune_connection()
 
-    # Create superuser
-    create_superuser()
+        # Create superuser
+        create_superuser()
 
-    # Load test fixtures
-    load_fixtures()
+        # Load test fixtures
+        load_fixtures()
 
-    # Clean up migrations if we created them
-    if created_migrations:
-        migrations_dir = Path("iscc_hub/migrations")
-        cleanup_migrations(migrations_dir)
+        if fresh:
+            save_snapshot(db_path)
 
     print("\n✅ Database reset complete!")
     print_summary()
@@ -4,31 +4,48 @@ Create and submit a valid ISCC declaration to the hub.
 
 This script creates a valid IsccNote, signs it, and submits it to the local hub
 via POST request to localhost:8000/declaration.
+
+Pass a count (e.g. `declaration.py 500`) to submit that many declarations concurrently for load testing.
 """
 
+import asyncio
 import json
+import os
 import secrets
 import sys
 from datetime import UTC, datetime
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 
+import httpx
 import iscc_core as ic
 import iscc_crypto as icr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Add project root to Python path for imports
 BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
+# Shared HTTP session so repeated submissions reuse pooled keep-alive connections.
+# POST is not idempotent, so urllib3 only retries it on connection errors.
+_ADAPTER = HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.1))
+_SESSION = requests.Session()
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
 
 def create_iscc_from_text(text="Hello World!"):
     # type: (str) -> dict
     """Create deterministic ISCC components from text."""
     mcode = ic.gen_meta_code(text, "Test Description", bits=256)
     ccode = ic.gen_text_code(text, bits=256)
-    dcode = ic.gen_data_code(BytesIO(text.encode("utf-8")), bits=256)
-    icode = ic.gen_instance_code(BytesIO(text.encode("utf-8")), bits=256)
+    data = BytesIO(text.encode("utf-8"))
+    dcode = ic.gen_data_code(data, bits=256)
+    data.seek(0)
+    icode = ic.gen_instance_code(data, bits=256)
     iscc_code = ic.gen_iscc_code([mcode["iscc"], ccode["iscc"], dcode["iscc"], icode["iscc"]])["iscc"]
 
     result = {}
@@ -41,14 +58,20 @@ def create_iscc_from_text(text="Hello World!"):
     return result
 
 
+@lru_cache(maxsize=128)
+def get_keypair(controller="did:web:example.com"):
+    # type: (str) -> icr.KeyPair
+    """Generate a keypair once per controller and reuse it on subsequent calls."""
+    return icr.key_generate(controller=controller)
+
+
 def generate_nonce(hub_id=0):
     # type: (int) -> str
     """Generate a nonce with hub_id prefix."""
     # First 12 bits = hub_id (0 = 0x000)
     hub_prefix = f"{hub_id:03x}"
     # Remaining 29 hex chars (116 bits) random
-    random_suffix = secrets.token_hex(14) + secrets.token_hex(1)[:1]
-    return hub_prefix + random_suffix
+    return hub_prefix + os.urandom(15).hex()[:29]
 
 
 def generate_random_text():
@@ -90,8 +113,7 @@ def generate_random_text():
 def create_timestamp():
     # type: () -> str
     """Create current timestamp in ISO format with millisecond precision."""
-    now = datetime.now(UTC)
-    return now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    return datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
 def create_minimal_iscc_note(text=None):
@@ -104,9 +126,8 @@ def create_minimal_iscc_note(text=None):
     # Generate ISCC data from text
     iscc_data = create_iscc_from_text(text)
 
-    # Generate keypair
-    controller = "did:web:example.com"
-    keypair = icr.key_generate(controller=controller)
+    # Reuse cached keypair
+    keypair = get_keypair()
 
     # Create minimal note
     note = {
@@ -131,9 +152,8 @@ def create_full_iscc_note(text=None):
     # Generate ISCC data from text
     iscc_data = create_iscc_from_text(text)
 
-    # Generate keypair
-    controller = "did:web:example.com"
-    keypair = icr.key_generate(controller=controller)
+    # Reuse cached keypair
+    keypair = get_keypair()
 
     # Create full note with optional fields
     note = {
@@ -158,7 +178,7 @@ def submit_declaration(note, base_url="http://localhost:8000"):
     headers = {"Content-Type": "application/json", "Accept": "application/json"}
 
     try:
-        response = requests.post(url, json=note, headers=headers, timeout=30)
+        response = _SESSION.post(url, json=note, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -169,8 +189,50 @@ def submit_declaration(note, base_url="http://localhost:8000"):
         raise
 
 
+async def _create_and_submit(client, semaphore, url):
+    # type: (httpx.AsyncClient, asyncio.Semaphore, str) -> dict
+    """Create a note off the event loop and submit it with the shared async client."""
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        note = await loop.run_in_executor(None, create_full_iscc_note)
+        response = await client.post(url, json=note)
+        response.raise_for_status()
+        return response.json()
+
+
+def bulk_declare(n, base_url="http://localhost:8000", concurrency=64):
+    # type: (int, str, int) -> list[dict]
+    """Create and submit n random declarations concurrently over one pooled client."""
+    url = f"{base_url}/declaration"
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    async def run():
+        # type: () -> list[dict]
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30) as client:
+            return await asyncio.gather(*(_create_and_submit(client, semaphore, url) for _ in range(n)))
+
+    return asyncio.run(run())
+
+
 def main():
     """Create and submit ISCC declaration."""
+    if len(sys.argv) > 1:
+        try:
+            count = int(sys.argv[1])
+        except ValueError:
+            print("Usage: python scripts/declaration.py [count]")
+            return 1
+        print(f"Submitting {count} declarations to localhost:8000/declaration...")
+        try:
+            results = bulk_declare(count)
+        except Exception as e:
+            print(f"\nFailed to submit declarations: {e}")
+            return 1
+        print(f"Submitted {len(results)} declarations")
+        return 0
+
     print("Creating ISCC declaration...")
 
     # Create a full ISCC note with random text
@@ -5,6 +5,7 @@ import json
 import os
 import sys
 from datetime import UTC, datetime, timezone
+from functools import cache
 from io import BytesIO
 
 import django
@@ -19,6 +20,12 @@ django.setup()
 EXAMPLE_PRIVATE_KEY = "z3u2RDonZ81AFKiw8QCPKcsyg8Yy2MmYQNxfBn51SS2QmMiw"
 
 
+@cache
+def example_keypair(controller=None):
+    """Derive the deterministic example keypair once per controller"""
+    return icr.key_from_secret(EXAMPLE_PRIVATE_KEY, controller=controller)
+
+
 def create_iscc():
     """Create a valid ISCC-CODE and metadata for IsccNote creation"""
     text = "Hello World!"
@@ -37,14 +44,19 @@ def create_iscc():
     return result
 
 
-def create_note_min(nonce=None, timestamp=None, keypair=None):
-    """Create a minimal IsccNote"""
-    nonce = nonce or icr.create_nonce(0)
+def create_timestamp():
+    """Create current timestamp in ISO format with millisecond precision"""
     # Client-side timestamp with millisecond precision (3 decimal places) for cross-platform compatibility
     # The hub will generate its own microsecond-precision timestamp in the ISCC-ID
-    timestamp = timestamp or datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-    keypair = keypair or icr.key_generate()
-    data = create_iscc()
+    return datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def create_note_min(nonce=None, timestamp=None, keypair=None, data=None):
+    """Create a minimal IsccNote"""
+    nonce = nonce or icr.create_nonce(0)
+    timestamp = timestamp or create_timestamp()
+    keypair = keypair or example_keypair()
+    data = data or create_iscc()
     minimal_iscc_note = {
         "iscc_code": data["iscc"],
         "datahash": data["datahash"],
@@ -56,15 +68,13 @@ def create_note_min(nonce=None, timestamp=None, keypair=None):
     return signed_minimal_iscc_note
 
 
-def create_note_full(nonce=None, timestamp=None, keypair=None, controller=None):
+def create_note_full(nonce=None, timestamp=None, keypair=None, controller=None, data=None):
     """Create a full IsccNote"""
     nonce = nonce or icr.create_nonce(0)
-    # Client-side timestamp with millisecond precision (3 decimal places) for cross-platform compatibility
-    # The hub will generate its own microsecond-precision timestamp in the ISCC-ID
-    timestamp = timestamp or datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    timestamp = timestamp or create_timestamp()
     controller = controller or "did:web:example.com"
-    keypair = keypair or icr.key_generate(controller=controller)
-    data = create_iscc()
+    keypair = keypair or example_keypair(controller)
+    data = data or create_iscc()
     full_iscc_note = {
         "iscc_code": data["iscc"],
         "datahash": data["datahash"],
@@ -80,5 +90,6 @@ def create_note_full(nonce=None, timestamp=None, keypair=None, controller=None):
 
 
 if __name__ == "__main__":
-    print(json.dumps(create_note_min(), indent=2))
-    print(json.dumps(create_note_full(), indent=2))
+    data = create_iscc()
+    print(json.dumps(create_note_min(data=data), indent=2))
+    print(json.dumps(create_note_full(data=data), indent=2))
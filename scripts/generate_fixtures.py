@@ -6,12 +6,12 @@ This script creates a fresh database, populates it with realistic ISCC declarati
 using valid IsccNotes, and dumps the data as Django fixtures.
 """
 
-import json
 import os
 import sys
-import tempfile
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from io import BytesIO
+from itertools import chain
 from pathlib import Path
 
 import django
@@ -21,36 +21,37 @@ import iscc_crypto as icr
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Configure Django with a temporary database for fixture generation
-temp_db = tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False)
-temp_db_path = temp_db.name
-temp_db.close()
-
+# Configure Django with an in-memory database for fixture generation
 os.environ["DJANGO_SETTINGS_MODULE"] = "iscc_hub.settings"
-os.environ["ISCC_HUB_DB_NAME"] = temp_db_path
+os.environ["ISCC_HUB_DB_NAME"] = ":memory:"
 os.environ.setdefault("ISCC_HUB_ID", "1")
 os.environ.setdefault("ISCC_HUB_DOMAIN", "hub.example.com")
 os.environ.setdefault("ISCC_HUB_SECKEY", "zHuboTestKeyFixtureGeneration")
 
 django.setup()
 
+from django.apps import apps  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.core import serializers  # noqa: E402
 from django.core.management import call_command  # noqa: E402
+from django.db import transaction  # noqa: E402
 
 from iscc_hub.models import Event, IsccDeclaration  # noqa: E402
 from iscc_hub.sequencer import sequence_iscc_note  # noqa: E402
 from iscc_hub.validators import validate_iscc_note  # noqa: E402
 
 
+@lru_cache(maxsize=8)
 def create_iscc_from_text(text="Hello World!"):
     # type: (str) -> dict
-    """Generate ISCC codes from text content."""
+    """Generate ISCC codes from text content (cached per text, do not mutate the result)."""
     text_bytes = BytesIO(text.encode("utf-8"))
-    text_bytes_copy = BytesIO(text.encode("utf-8"))
 
     mcode = ic.gen_meta_code(text, "Test Description", bits=256)
     ccode = ic.gen_text_code(text, bits=256)
     dcode = ic.gen_data_code(text_bytes, bits=256)
-    icode = ic.gen_instance_code(text_bytes_copy, bits=256)
+    text_bytes.seek(0)
+    icode = ic.gen_instance_code(text_bytes, bits=256)
 
     iscc_code = ic.gen_iscc_code([mcode["iscc"], ccode["iscc"], dcode["iscc"], icode["iscc"]])["iscc"]
 
@@ -65,12 +66,11 @@ def create_iscc_from_text(text="Hello World!"):
     return result
 
 
-def create_minimal_note(timestamp, nonce=None, keypair=None):
-    # type: (str, str|None, icr.KeyPair|None) -> dict
-    """Create a minimal signed IsccNote."""
+def create_minimal_note(timestamp, nonce=None, data=None):
+    # type: (str, str|None, dict|None) -> dict
+    """Create a minimal unsigned IsccNote."""
     nonce = nonce or icr.create_nonce(1)  # Use hub_id=1
-    keypair = keypair or icr.key_generate()
-    data = create_iscc_from_text()
+    data = data or create_iscc_from_text()
 
     minimal_note = {
         "iscc_code": data["iscc"],
@@ -79,15 +79,14 @@ def create_minimal_note(timestamp, nonce=None, keypair=None):
         "timestamp": timestamp,
     }
 
-    return icr.sign_json(minimal_note, keypair)
+    return minimal_note
 
 
-def create_full_note(timestamp, nonce=None, keypair=None):
-    # type: (str, str|None, icr.KeyPair|None) -> dict
-    """Create a full signed IsccNote with optional fields."""
+def create_full_note(timestamp, nonce=None, data=None):
+    # type: (str, str|None, dict|None) -> dict
+    """Create a full unsigned IsccNote with optional fields."""
     nonce = nonce or icr.create_nonce(1)
-    keypair = keypair or icr.key_generate()
-    data = create_iscc_from_text()
+    data = data or create_iscc_from_text()
 
     full_note = {
         "iscc_code": data["iscc"],
@@ -99,15 +98,14 @@ def create_full_note(timestamp, nonce=None, keypair=None):
         "metahash": data["metahash"],
     }
 
-    return icr.sign_json(full_note, keypair)
+    return full_note
 
 
-def create_note_with_units(timestamp, nonce=None, keypair=None):
-    # type: (str, str|None, icr.KeyPair|None) -> dict
-    """Create a signed IsccNote with units field."""
+def create_note_with_units(timestamp, nonce=None, data=None):
+    # type: (str, str|None, dict|None) -> dict
+    """Create an unsigned IsccNote with units field."""
     nonce = nonce or icr.create_nonce(1)
-    keypair = keypair or icr.key_generate()
-    data = create_iscc_from_text("Different content for variety")
+    data = data or create_iscc_from_text("Different content for variety")
 
     note = {
         "iscc_code": data["iscc"],
@@ -117,7 +115,7 @@ def create_note_with_units(timestamp, nonce=None, keypair=None):
         "units": data["units"],
     }
 
-    return icr.sign_json(note, keypair)
+    return note
 
 
 def create_timestamp(base_time, offset_seconds=0):
@@ -129,9 +127,10 @@ def create_timestamp(base_time, offset_seconds=0):
     :param offset_seconds: Seconds to add to base time
     :return: ISO format timestamp string with millisecond precision
     """
-    timestamp = base_time + timedelta(seconds=offset_seconds)
-    # Format with millisecond precision (3 decimal places)
-    return timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    t = base_time + timedelta(seconds=offset_seconds)
+    # Format with millisecond precision (3 decimal places) without going through strftime
+    ms = t.microsecond // 1000
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d}T{t.hour:02d}:{t.minute:02d}:{t.second:02d}.{ms:03d}Z"
 
 
 def process_iscc_note(iscc_note):
@@ -154,99 +153,108 @@ def process_iscc_note(iscc_note):
     return sequence_iscc_note(validated_note)
 
 
+def build_declaration(iscc_note, seq, iscc_id):
+    # type: (dict, int, bytes) -> IsccDeclaration
+    """
+    Build the unsaved IsccDeclaration for a sequenced note, as the declaration endpoint does.
+
+    :param iscc_note: The validated and sequenced ISCC note
+    :param seq: Event sequence number issued by the sequencer
+    :param iscc_id: ISCC-ID bytes issued by the sequencer
+    :return: Unsaved IsccDeclaration instance
+    """
+    return IsccDeclaration(
+        iscc_id=iscc_id,
+        event_seq=seq,
+        iscc_code=iscc_note["iscc_code"],
+        datahash=iscc_note["datahash"],
+        nonce=iscc_note["nonce"],
+        actor=iscc_note["signature"]["pubkey"],
+        gateway=iscc_note.get("gateway", ""),
+        metahash=iscc_note.get("metahash", ""),
+    )
+
+
 def generate_fixtures():
     # type: () -> None
     """Generate realistic fixture data."""
-    print(f"Using temporary database: {temp_db_path}")
-
-    # Run migrations to create tables
-    print("Running migrations...")
-    call_command("migrate", "--run-syncdb", verbosity=0)
+    print("Using in-memory database")
 
-    # Clear any existing data
-    Event.objects.all().delete()
-    IsccDeclaration.objects.all().delete()
+    # Create tables directly from models instead of replaying migrations
+    print("Creating tables...")
+    settings.MIGRATION_MODULES = {app.label: None for app in apps.get_app_configs()}
+    call_command("migrate", "--run-syncdb", interactive=False, verbosity=0)
 
     # Base time for realistic timestamps (current time minus a few minutes)
     base_time = datetime.now(UTC) - timedelta(minutes=5)
 
     print("Creating test data...")
 
+    # ISCC codes of both fixture texts (cached, shared by all notes)
+    default_data = create_iscc_from_text("Hello World!")
+    variety_data = create_iscc_from_text("Different content for variety")
+
     # Generate multiple keypairs for different actors
     keypair1 = icr.key_generate()
     keypair2 = icr.key_generate()
     keypair3 = icr.key_generate()
 
-    # 1. Create initial declaration with full IsccNote
-    note1 = create_full_note(timestamp=create_timestamp(base_time, 0), keypair=keypair1)
-    seq1, iscc_id1 = process_iscc_note(note1)
-    print("  - Created full declaration")
-
-    # 2. Create minimal declaration
-    note2 = create_minimal_note(
-        timestamp=create_timestamp(base_time, 60),  # 1 minute later
-        keypair=keypair2,
-    )
-    seq2, iscc_id2 = process_iscc_note(note2)
-    print("  - Created minimal declaration")
-
-    # 3. Create declaration with units
-    note3 = create_note_with_units(
-        timestamp=create_timestamp(base_time, 120),  # 2 minutes later
-        keypair=keypair3,
-    )
-    seq3, iscc_id3 = process_iscc_note(note3)
-    print("  - Created declaration with units")
-
-    # 4. Create another minimal declaration (different content)
-    note4 = create_minimal_note(
-        timestamp=create_timestamp(base_time, 180),  # 3 minutes later
-        keypair=keypair1,  # Same actor as first
-    )
-    seq4, iscc_id4 = process_iscc_note(note4)
-    print("  - Created another declaration from first actor")
-
-    # 5. Create one more declaration for variety
-    note5 = create_full_note(
-        timestamp=create_timestamp(base_time, 240),  # 4 minutes later
-        keypair=keypair2,  # Different actor
-    )
-    seq5, iscc_id5 = process_iscc_note(note5)
-    print("  - Created fifth declaration")
-
-    # Print summary
-    print(f"\nCreated {Event.objects.count()} events")
-    print(f"Created {IsccDeclaration.objects.count()} declarations")
+    # Notes in declaration order (label, unsigned note, signing keypair)
+    notes = [
+        # 1. Initial declaration with full IsccNote
+        ("full declaration", create_full_note(create_timestamp(base_time, 0), data=default_data), keypair1),
+        # 2. Minimal declaration 1 minute later
+        (
+            "minimal declaration",
+            create_minimal_note(create_timestamp(base_time, 60), data=default_data),
+            keypair2,
+        ),
+        # 3. Declaration with units 2 minutes later
+        (
+            "declaration with units",
+            create_note_with_units(create_timestamp(base_time, 120), data=variety_data),
+            keypair3,
+        ),
+        # 4. Another minimal declaration 3 minutes later from the same actor as the first
+        (
+            "another declaration from first actor",
+            create_minimal_note(create_timestamp(base_time, 180), data=default_data),
+            keypair1,
+        ),
+        # 5. One more full declaration 4 minutes later from a different actor
+        ("fifth declaration", create_full_note(create_timestamp(base_time, 240), data=default_data), keypair2),
+    ]
+
+    # Sign and sequence in declaration order (the sequencer commits each event in its own transaction)
+    declarations = []
+    for label, note, keypair in notes:
+        signed_note = icr.sign_json(note, keypair)
+        seq, iscc_id = process_iscc_note(signed_note)
+        declarations.append(build_declaration(signed_note, seq, iscc_id))
+        print(f"  - Created {label}")
+
+    # Materialize all declarations with a single bulk insert
+    with transaction.atomic():
+        IsccDeclaration.objects.bulk_create(declarations, batch_size=500)
+
+    # Print summary (each sequenced note produced one event and one declaration)
+    print(f"\nCreated {len(notes)} events")
+    print(f"Created {len(declarations)} declarations")
 
     # Dump the fixtures
     output_file = Path(__file__).parent.parent / "iscc_hub" / "fixtures" / "test_data.json"
     print(f"\nDumping fixtures to {output_file}...")
 
+    # Stream rows straight into the file instead of building the whole dump in memory
+    records = chain(
+        Event.objects.order_by("pk").iterator(chunk_size=500),
+        IsccDeclaration.objects.order_by("pk").iterator(chunk_size=500),
+    )
     with open(output_file, "w") as f:
-        call_command(
-            "dumpdata",
-            "iscc_hub.Event",
-            "iscc_hub.IsccDeclaration",
-            format="json",
-            indent=2,
-            stdout=f,
-        )
+        serializers.serialize("json", records, indent=None, stream=f)
 
     print(f"Fixtures saved to {output_file}")
 
-    # Close database connection before cleanup
-    from django import db
-
-    db.connections.close_all()
-
-    # Clean up temporary database
-    try:
-        os.unlink(temp_db_path)
-        print("Cleaned up temporary database")
-    except PermissionError:
-        print(f"Note: Temporary database at {temp_db_path} could not be deleted (Windows file lock)")
-        print("It will be cleaned up automatically on next reboot")
-
 
 if __name__ == "__main__":
     try:
@@ -256,13 +264,4 @@ if __name__ == "__main__":
 
         print(f"Error generating fixtures: {e}")
         traceback.print_exc()
-        # Try to clean up on error
-        if "temp_db_path" in locals() and os.path.exists(temp_db_path):
-            try:
-                from django import db
-
-                db.connections.close_all()
-                os.unlink(temp_db_path)
-            except Exception:
-                pass
         sys.exit(1)
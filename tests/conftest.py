@@ -2,24 +2,32 @@
 Pytest configuration for Django testing.
 """
 
+import copy
 import os
-import sys
+from functools import cache
 from io import BytesIO
 from pathlib import Path
+from types import MappingProxyType
 
 import django
-import iscc_core as ic
-import iscc_crypto as icr
 import pytest
 
-# Add project root to Python path
 BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BASE_DIR))
 
 # Test data directory
 DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
+# Keep the test database on tmpfs where available (Linux) to avoid disk syncs
+SHM_DIR = Path("/dev/shm")
+# One database per pytest-xdist worker so parallel runs (pytest -n auto) do not share a file
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DB_PATH = (
+    SHM_DIR / f"iscc_hub_test_{os.getuid()}_{WORKER_ID}.sqlite3"
+    if SHM_DIR.is_dir()
+    else DATA_DIR / f"test_db_{WORKER_ID}.sqlite3"
+)
+
 
 def pytest_configure(config):
     """Configure Django settings for testing."""
@@ -28,7 +36,7 @@ def pytest_configure(config):
         "DJANGO_SETTINGS_MODULE": "iscc_hub.settings",
         "DJANGO_DEBUG": "True",
         "DJANGO_SECRET_KEY": "test-secret-key-for-testing-only",
-        "ISCC_HUB_DB_NAME": str(DATA_DIR / "test_db.sqlite3"),
+        "ISCC_HUB_DB_NAME": str(TEST_DB_PATH),
         "ISCC_HUB_DOMAIN": "testserver",
         "ISCC_HUB_SECKEY": "z3u2hnGm6Vp6zXdB4x51vp2VMGqHfB6BcF3cvgkC5aDxPsJR",
         "ISCC_HUB_ID": "1",
@@ -40,8 +48,22 @@ def pytest_configure(config):
     for key, value in test_env_vars.items():
         os.environ[key] = value
 
-    # Setup Django
-    django.setup()
+    # Setup Django (skip if pytest-django already populated the app registry)
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+    from django.conf import settings
+
+    db = settings.DATABASES["default"]
+    # Reuse database connections across request cycles instead of reconnecting per request
+    db["CONN_MAX_AGE"] = None
+    db["TEST"]["NAME"] = TEST_DB_PATH
+    # The test database is throwaway, skip fsyncs but keep WAL so concurrent connections behave as in production
+    db["OPTIONS"]["init_command"] = (
+        "PRAGMA journal_mode=WAL;PRAGMA synchronous=OFF;PRAGMA temp_store=MEMORY;PRAGMA busy_timeout=5000;"
+    )
 
 
 @pytest.fixture(scope="session")
@@ -55,24 +77,35 @@ def django_db_use_migrations():
     return False
 
 
-@pytest.fixture
-def api_client(db):
-    """Provide Django Ninja TestAsyncClient for API testing."""
+@pytest.fixture(scope="session")
+def _api_client():
+    """Build the Django Ninja TestAsyncClient once per session."""
     from ninja.testing import TestAsyncClient
 
     from iscc_hub.api import api
 
-    # Ensure database is available and properly initialized
     return TestAsyncClient(api)
 
 
+@pytest.fixture
+def api_client(db, _api_client):
+    """Provide Django Ninja TestAsyncClient for API testing."""
+    # Ensure database is available and properly initialized
+    return _api_client
+
+
+@cache
 def create_iscc_from_text(text="Hello World!"):
     # type: (str) -> dict
-    """Create deterministic ISCC components from text."""
+    """Create deterministic ISCC components from text (cached per text, do not mutate the result)."""
+    import iscc_core as ic
+
     mcode = ic.gen_meta_code(text, "Test Description", bits=256)
     ccode = ic.gen_text_code(text, bits=256)
-    dcode = ic.gen_data_code(BytesIO(text.encode("utf-8")), bits=256)
-    icode = ic.gen_instance_code(BytesIO(text.encode("utf-8")), bits=256)
+    data = BytesIO(text.encode("utf-8"))
+    dcode = ic.gen_data_code(data, bits=256)
+    data.seek(0)
+    icode = ic.gen_instance_code(data, bits=256)
     iscc_code = ic.gen_iscc_code([mcode["iscc"], ccode["iscc"], dcode["iscc"], icode["iscc"]])["iscc"]
 
     result = {}
@@ -85,15 +118,18 @@ def create_iscc_from_text(text="Hello World!"):
     return result
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_keypair():
     # type: () -> icr.KeyPair
     """Generate a deterministic test keypair."""
+    import iscc_crypto as icr
+
     # Use a fixed controller for deterministic output
     controller = "did:web:example.com"
     return icr.key_generate(controller=controller)
 
 
+@cache
 def generate_test_iscc_id(hub_id=1, seq=1):
     # type: (int, int) -> str
     """Generate a valid test ISCC-ID with deterministic timestamp."""
@@ -105,7 +141,14 @@ def generate_test_iscc_id(hub_id=1, seq=1):
     return str(IsccID.from_timestamp(timestamp_us, hub_id))
 
 
-@pytest.fixture
+@cache
+def generate_test_nonce(seq=1):
+    # type: (int) -> str
+    """Generate a unique 128-bit hex test nonce derived from seq."""
+    return f"{seq:032x}"
+
+
+@pytest.fixture(scope="session")
 def example_nonce():
     # type: () -> str
     """Return a deterministic test nonce."""
@@ -113,7 +156,7 @@ def example_nonce():
     return "001faa3f18c7b9407a48536a9b00c4cb"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_timestamp():
     # type: () -> str
     """Return a deterministic test timestamp."""
@@ -130,17 +173,23 @@ def current_timestamp():
     return now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_iscc_data():
-    # type: () -> dict
-    """Return deterministic ISCC data from 'Hello World!' text."""
-    return create_iscc_from_text()
+    # type: () -> MappingProxyType
+    """
+    Return deterministic ISCC data from 'Hello World!' text.
 
+    Computed once per session and returned as a read-only view.
+    """
+    return MappingProxyType(create_iscc_from_text())
 
-@pytest.fixture
-def minimal_iscc_note(example_nonce, example_timestamp, example_keypair, example_iscc_data):
+
+@pytest.fixture(scope="session")
+def _minimal_iscc_note(example_nonce, example_timestamp, example_keypair, example_iscc_data):
     # type: (str, str, icr.KeyPair, dict) -> dict
-    """Create a minimal signed IsccNote with deterministic values."""
+    """Sign the minimal IsccNote once per session."""
+    import iscc_crypto as icr
+
     minimal_note = {
         "iscc_code": example_iscc_data["iscc"],
         "datahash": example_iscc_data["datahash"],
@@ -153,10 +202,12 @@ def minimal_iscc_note(example_nonce, example_timestamp, example_keypair, example
     return signed_note
 
 
-@pytest.fixture
-def full_iscc_note(example_nonce, example_timestamp, example_keypair, example_iscc_data):
+@pytest.fixture(scope="session")
+def _full_iscc_note(example_nonce, example_timestamp, example_keypair, example_iscc_data):
     # type: (str, str, icr.KeyPair, dict) -> dict
-    """Create a full signed IsccNote with all optional fields."""
+    """Sign the full IsccNote once per session."""
+    import iscc_crypto as icr
+
     full_note = {
         "iscc_code": example_iscc_data["iscc"],
         "datahash": example_iscc_data["datahash"],
@@ -172,6 +223,20 @@ def full_iscc_note(example_nonce, example_timestamp, example_keypair, example_is
     return signed_note
 
 
+@pytest.fixture
+def minimal_iscc_note(_minimal_iscc_note):
+    # type: (dict) -> dict
+    """Create a minimal signed IsccNote with deterministic values."""
+    return copy.deepcopy(_minimal_iscc_note)
+
+
+@pytest.fixture
+def full_iscc_note(_full_iscc_note):
+    # type: (dict) -> dict
+    """Create a full signed IsccNote with all optional fields."""
+    return copy.deepcopy(_full_iscc_note)
+
+
 @pytest.fixture
 def unsigned_iscc_note(example_nonce, example_timestamp, example_iscc_data):
     # type: (str, str, dict) -> dict
@@ -190,18 +255,10 @@ def unsigned_iscc_note(example_nonce, example_timestamp, example_iscc_data):
 
 
 @pytest.fixture
-def invalid_signature_note(example_nonce, example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, str, icr.KeyPair, dict) -> dict
+def invalid_signature_note(_minimal_iscc_note):
+    # type: (dict) -> dict
     """Create an IsccNote with a tampered signature."""
-    note = {
-        "iscc_code": example_iscc_data["iscc"],
-        "datahash": example_iscc_data["datahash"],
-        "nonce": example_nonce,
-        "timestamp": example_timestamp,
-    }
-
-    # Sign the note
-    signed_note = icr.sign_json(note, example_keypair)
+    signed_note = copy.deepcopy(_minimal_iscc_note)
 
     # Tamper with the data after signing
     signed_note["nonce"] = "fffaaa3f18c7b9407a48536a9b00c4cb"
@@ -209,23 +266,91 @@ def invalid_signature_note(example_nonce, example_timestamp, example_keypair, ex
     return signed_note
 
 
+@pytest.fixture
+def fast_sign(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """
+    Replace icr.sign_json with a stub that attaches a fake signature.
+
+    Only for tests that store notes as payload and never verify their signatures.
+    """
+    import iscc_crypto as icr
+
+    def sign_json(obj, keypair):
+        # type: (dict, icr.KeyPair) -> dict
+        signature = {"version": "ISCC-SIG v1.0", "pubkey": keypair.public_key, "proof": "zFake"}
+        return {**obj, "signature": signature}
+
+    monkeypatch.setattr(icr, "sign_json", sign_json)
+
+
+@pytest.fixture
+def fast_verify(monkeypatch):
+    # type: (pytest.MonkeyPatch) -> None
+    """
+    Skip Ed25519 verification in validate_iscc_note.
+
+    Only for API tests whose assertions do not depend on the signature check.
+    """
+    from iscc_hub import validators
+
+    monkeypatch.setattr(validators, "verify_signature_cryptographically", lambda data: None)
+
+
 # Factory functions for test objects
+TEST_DATAHASH = "1e203b49776cc59dc94dc1ce328e6c4a5777c7816ebf1e10e87ac3cb061ce1037c6c"
+
+# Static field values, only the seq-derived fields are computed per object
+DECLARATION_TEMPLATE = {
+    "iscc_code": "ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY",
+    "datahash": TEST_DATAHASH,
+    "actor": "7VWFd39mGRe6B9KwFa5qPQkqbTYXBgTRgGPvs3QHrEV5",
+    "deleted": False,
+}
+
+
+def make_declaration_fields(seq=1, **overrides):
+    # type: (int, dict) -> dict
+    """Return field values for a test IsccDeclaration with unique values derived from seq."""
+    return {
+        **DECLARATION_TEMPLATE,
+        "iscc_id": generate_test_iscc_id(seq=seq),
+        "event_seq": seq,
+        "nonce": generate_test_nonce(seq),
+        **overrides,
+    }
+
+
+def make_event_fields(seq=1, **overrides):
+    # type: (int, dict) -> dict
+    """Return field values for a test Event with unique values derived from seq."""
+    return {
+        "seq": seq,
+        "iscc_note": {"test": "data"},
+        "iscc_id": generate_test_iscc_id(seq=seq),
+        "nonce": generate_test_nonce(seq),
+        "datahash": TEST_DATAHASH,
+        **overrides,
+    }
+
+
 def create_test_declaration(seq=1, **overrides):
     # type: (int, dict) -> object
     """Factory function for creating test IsccDeclaration objects."""
     from iscc_hub.models import IsccDeclaration
 
-    defaults = {
-        "iscc_id": generate_test_iscc_id(seq=seq),
-        "event_seq": seq,
-        "iscc_code": "ISCC:KACYPXW445FTYNJ3CYSXHAFJMA2HUWULUNRFE3BLHRSCXYH2M5AEGQY",
-        "datahash": "1e203b49776cc59dc94dc1ce328e6c4a5777c7816ebf1e10e87ac3cb061ce1037c6c",
-        "nonce": f"{seq:032x}",  # Generate unique nonce based on seq
-        "actor": "7VWFd39mGRe6B9KwFa5qPQkqbTYXBgTRgGPvs3QHrEV5",
-        "deleted": False,
-    }
-    defaults.update(overrides)
-    return IsccDeclaration.objects.create(**defaults)
+    return IsccDeclaration.objects.create(**make_declaration_fields(seq, **overrides))
+
+
+def create_test_declarations(n, start_seq=1, **overrides):
+    # type: (int, int, dict) -> list
+    """Create `n` test IsccDeclaration objects with consecutive seq values in one bulk insert."""
+    from iscc_hub.models import IsccDeclaration
+
+    objs = [
+        IsccDeclaration(**make_declaration_fields(seq, **overrides)) for seq in range(start_seq, start_seq + n)
+    ]
+    return IsccDeclaration.objects.bulk_create(objs, batch_size=500)
 
 
 def create_test_event(seq=1, **overrides):
@@ -233,13 +358,16 @@ def create_test_event(seq=1, **overrides):
     """Factory function for creating test Event objects."""
     from iscc_hub.models import Event
 
-    defaults = {
-        "seq": seq,
-        "note": {"test": "data"},
-        "iscc_id": generate_test_iscc_id(seq=seq),
-    }
-    defaults.update(overrides)
-    return Event.objects.create(**defaults)
+    return Event.objects.create(**make_event_fields(seq, **overrides))
+
+
+def create_test_events(n, start_seq=1, **overrides):
+    # type: (int, int, dict) -> list
+    """Create `n` test Event objects with consecutive seq values in one bulk insert."""
+    from iscc_hub.models import Event
+
+    objs = [Event(**make_event_fields(seq, **overrides)) for seq in range(start_seq, start_seq + n)]
+    return Event.objects.bulk_create(objs, batch_size=500)
 
 
 # Helper functions for testing
@@ -14,6 +14,21 @@ from iscc_hub.admin import EventAdmin, IsccDeclarationAdmin
 from iscc_hub.models import Event, IsccDeclaration
 
 
+class FakeAdminUser:
+    """Lightweight stand-in for an active superuser."""
+
+    is_active = True
+    is_staff = True
+    is_superuser = True
+
+    def has_perm(self, perm, obj=None):
+        # type: (str, object) -> bool
+        return True
+
+
+ADMIN_USER = FakeAdminUser()
+
+
 @pytest.fixture
 def rf():
     # type: () -> RequestFactory
@@ -26,10 +41,24 @@ def admin_request(rf):
     # type: (RequestFactory) -> HttpRequest
     """Admin request fixture."""
     request = rf.get("/admin/")
-    request.user = Mock()
+    request.user = ADMIN_USER
     return request
 
 
+@pytest.fixture(scope="session")
+def declaration_admin():
+    # type: () -> IsccDeclarationAdmin
+    """Shared IsccDeclarationAdmin instance."""
+    return IsccDeclarationAdmin(IsccDeclaration, site)
+
+
+@pytest.fixture(scope="session")
+def event_admin():
+    # type: () -> EventAdmin
+    """Shared EventAdmin instance."""
+    return EventAdmin(Event, site)
+
+
 @pytest.fixture
 def iscc_declaration():
     # type: () -> IsccDeclaration
@@ -67,10 +96,9 @@ class TestIsccDeclarationAdmin:
         assert IsccDeclaration in site._registry
         assert isinstance(site._registry[IsccDeclaration], IsccDeclarationAdmin)
 
-    def test_list_display(self):
-        # type: () -> None
+    def test_list_display(self, declaration_admin):
+        # type: (IsccDeclarationAdmin) -> None
         """Test list_display configuration."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         expected = [
             "iscc_id_display",
             "iscc_code_short",
@@ -80,87 +108,70 @@ class TestIsccDeclarationAdmin:
             "is_deleted",
             "redacted",
         ]
-        assert admin_obj.list_display == expected
+        assert declaration_admin.list_display == expected
 
-    def test_iscc_id_display(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_iscc_id_display(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test ISCC-ID display."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        result = admin_obj.iscc_id_display(iscc_declaration)
+        result = declaration_admin.iscc_id_display(iscc_declaration)
         assert result == "ISCC:KAA777777UJZXHQ2"
 
-    def test_iscc_code_short_truncated(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
-        """Test ISCC-CODE truncation for long codes."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        iscc_declaration.iscc_code = "ISCC:" + "A" * 50
-        result = admin_obj.iscc_code_short(iscc_declaration)
-        assert '<span title="ISCC:' in result
-        assert "..." in result
-
-    def test_iscc_code_short_not_truncated(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
-        """Test ISCC-CODE display for short codes."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        iscc_declaration.iscc_code = "ISCC:SHORT"
-        result = admin_obj.iscc_code_short(iscc_declaration)
-        assert result == "ISCC:SHORT"
-
-    def test_actor_short_truncated(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
-        """Test actor truncation for long keys."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        iscc_declaration.actor = "a" * 50
-        result = admin_obj.actor_short(iscc_declaration)
-        assert '<span title="' in result
+    @pytest.mark.parametrize(
+        "field,value",
+        [("iscc_code", "ISCC:" + "A" * 50), ("actor", "a" * 50)],
+    )
+    def test_short_display_truncated(self, declaration_admin, iscc_declaration, field, value):
+        # type: (IsccDeclarationAdmin, IsccDeclaration, str, str) -> None
+        """Test truncation of long ISCC-CODEs and actor keys."""
+        setattr(iscc_declaration, field, value)
+        result = getattr(declaration_admin, f"{field}_short")(iscc_declaration)
+        assert f'<span title="{value}"' in result
         assert "..." in result
 
-    def test_actor_short_not_truncated(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
-        """Test actor display for short keys."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        iscc_declaration.actor = "short_key"
-        result = admin_obj.actor_short(iscc_declaration)
-        assert result == "short_key"
-
-    def test_gateway_domain_with_url(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    @pytest.mark.parametrize(
+        "field,value",
+        [("iscc_code", "ISCC:SHORT"), ("actor", "short_key")],
+    )
+    def test_short_display_not_truncated(self, declaration_admin, iscc_declaration, field, value):
+        # type: (IsccDeclarationAdmin, IsccDeclaration, str, str) -> None
+        """Test short ISCC-CODEs and actor keys are shown unchanged."""
+        setattr(iscc_declaration, field, value)
+        result = getattr(declaration_admin, f"{field}_short")(iscc_declaration)
+        assert result == value
+
+    def test_gateway_domain_with_url(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test gateway domain extraction from full URL."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.gateway = "https://example.com/path/to/gateway"
-        result = admin_obj.gateway_domain(iscc_declaration)
+        result = declaration_admin.gateway_domain(iscc_declaration)
         assert "example.com" in result
         assert "https://example.com/path/to/gateway" in result
         assert 'title="https://example.com/path/to/gateway"' in result
 
-    def test_gateway_domain_with_domain_only(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_gateway_domain_with_domain_only(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test gateway domain with domain-only input."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.gateway = "example.com"
-        result = admin_obj.gateway_domain(iscc_declaration)
+        result = declaration_admin.gateway_domain(iscc_declaration)
         assert "example.com" in result
 
-    def test_gateway_domain_empty(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_gateway_domain_empty(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test gateway domain with empty gateway."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.gateway = ""
-        result = admin_obj.gateway_domain(iscc_declaration)
+        result = declaration_admin.gateway_domain(iscc_declaration)
         assert result == "—"
 
-    def test_gateway_domain_none(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_gateway_domain_none(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test gateway domain with None gateway."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.gateway = None
-        result = admin_obj.gateway_domain(iscc_declaration)
+        result = declaration_admin.gateway_domain(iscc_declaration)
         assert result == "—"
 
-    def test_gateway_domain_format_error(self, iscc_declaration, monkeypatch):
-        # type: (IsccDeclaration, Any) -> None
+    def test_gateway_domain_format_error(self, declaration_admin, iscc_declaration, monkeypatch):
+        # type: (IsccDeclarationAdmin, IsccDeclaration, Any) -> None
         """Test gateway domain fallback when format_html fails."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.gateway = "https://example.com"
 
         # Mock format_html to raise an exception
@@ -169,120 +180,108 @@ class TestIsccDeclarationAdmin:
             raise ValueError("Format error")
 
         monkeypatch.setattr("iscc_hub.admin.format_html", mock_format_html)
-        result = admin_obj.gateway_domain(iscc_declaration)
+        result = declaration_admin.gateway_domain(iscc_declaration)
         # Should fallback to the original gateway value
         assert result == "https://example.com"
 
-    def test_is_deleted_true(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_is_deleted_true(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test deleted status display."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.deleted = True
-        result = admin_obj.is_deleted(iscc_declaration)
+        result = declaration_admin.is_deleted(iscc_declaration)
         assert "✗ Deleted" in result
         assert "color: red" in result
 
-    def test_is_deleted_false(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_is_deleted_false(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test active status display."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         iscc_declaration.deleted = False
-        result = admin_obj.is_deleted(iscc_declaration)
+        result = declaration_admin.is_deleted(iscc_declaration)
         assert "✓ Active" in result
         assert "color: green" in result
 
-    def test_creation_time(self, iscc_declaration):
-        # type: (IsccDeclaration) -> None
+    def test_creation_time(self, declaration_admin, iscc_declaration):
+        # type: (IsccDeclarationAdmin, IsccDeclaration) -> None
         """Test creation time extraction from ISCC-ID."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         # Test with valid ISCC-ID
         iscc_declaration.iscc_id = "ISCC:MEAJU3PC4ICWCTYI"
-        result = admin_obj.creation_time(iscc_declaration)
+        result = declaration_admin.creation_time(iscc_declaration)
         assert result == "2056-02-02T20:12:57.217556Z"
 
         # Test with None ISCC-ID
         iscc_declaration.iscc_id = None
-        result = admin_obj.creation_time(iscc_declaration)
+        result = declaration_admin.creation_time(iscc_declaration)
         assert result == "—"
 
-    def test_get_actions(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_get_actions(self, declaration_admin, admin_request):
+        # type: (IsccDeclarationAdmin, HttpRequest) -> None
         """Test custom actions configuration."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        actions = admin_obj.get_actions(admin_request)
+        actions = declaration_admin.get_actions(admin_request)
         assert "delete_selected" not in actions
         assert "soft_delete" in actions
         assert "restore" in actions
         assert "redact" in actions
         assert "unredact" in actions
 
-    @pytest.mark.django_db
-    def test_soft_delete_action(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_soft_delete_action(self, declaration_admin, admin_request, monkeypatch):
+        # type: (IsccDeclarationAdmin, HttpRequest, pytest.MonkeyPatch) -> None
         """Test soft delete action."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         queryset = Mock()
         queryset.update = Mock(return_value=3)
-        admin_obj.message_user = Mock()
+        monkeypatch.setattr(declaration_admin, "message_user", Mock())
 
-        admin_obj.soft_delete(admin_request, queryset)
+        declaration_admin.soft_delete(admin_request, queryset)
 
         queryset.update.assert_called_once_with(deleted=True)
-        admin_obj.message_user.assert_called_once_with(admin_request, "3 declaration(s) marked as deleted.")
+        declaration_admin.message_user.assert_called_once_with(
+            admin_request, "3 declaration(s) marked as deleted."
+        )
 
-    @pytest.mark.django_db
-    def test_restore_action(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_restore_action(self, declaration_admin, admin_request, monkeypatch):
+        # type: (IsccDeclarationAdmin, HttpRequest, pytest.MonkeyPatch) -> None
         """Test restore action."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         queryset = Mock()
         queryset.update = Mock(return_value=2)
-        admin_obj.message_user = Mock()
+        monkeypatch.setattr(declaration_admin, "message_user", Mock())
 
-        admin_obj.restore(admin_request, queryset)
+        declaration_admin.restore(admin_request, queryset)
 
         queryset.update.assert_called_once_with(deleted=False)
-        admin_obj.message_user.assert_called_once_with(admin_request, "2 declaration(s) restored.")
+        declaration_admin.message_user.assert_called_once_with(admin_request, "2 declaration(s) restored.")
 
-    @pytest.mark.django_db
-    def test_redact_action(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_redact_action(self, declaration_admin, admin_request, monkeypatch):
+        # type: (IsccDeclarationAdmin, HttpRequest, pytest.MonkeyPatch) -> None
         """Test redact action."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         queryset = Mock()
         queryset.update = Mock(return_value=4)
-        admin_obj.message_user = Mock()
+        monkeypatch.setattr(declaration_admin, "message_user", Mock())
 
-        admin_obj.redact(admin_request, queryset)
+        declaration_admin.redact(admin_request, queryset)
 
         queryset.update.assert_called_once_with(redacted=True)
-        admin_obj.message_user.assert_called_once_with(admin_request, "4 declaration(s) redacted.")
+        declaration_admin.message_user.assert_called_once_with(admin_request, "4 declaration(s) redacted.")
 
-    @pytest.mark.django_db
-    def test_unredact_action(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_unredact_action(self, declaration_admin, admin_request, monkeypatch):
+        # type: (IsccDeclarationAdmin, HttpRequest, pytest.MonkeyPatch) -> None
         """Test unredact action."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
         queryset = Mock()
         queryset.update = Mock(return_value=1)
-        admin_obj.message_user = Mock()
+        monkeypatch.setattr(declaration_admin, "message_user", Mock())
 
-        admin_obj.unredact(admin_request, queryset)
+        declaration_admin.unredact(admin_request, queryset)
 
         queryset.update.assert_called_once_with(redacted=False)
-        admin_obj.message_user.assert_called_once_with(admin_request, "1 declaration(s) unredacted.")
+        declaration_admin.message_user.assert_called_once_with(admin_request, "1 declaration(s) unredacted.")
 
-    def test_list_editable(self):
-        # type: () -> None
+    def test_list_editable(self, declaration_admin):
+        # type: (IsccDeclarationAdmin) -> None
         """Test list_editable configuration."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        assert admin_obj.list_editable == ["redacted"]
+        assert declaration_admin.list_editable == ["redacted"]
 
-    def test_has_add_permission(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_has_add_permission(self, declaration_admin, admin_request):
+        # type: (IsccDeclarationAdmin, HttpRequest) -> None
         """Test that adding declarations is prevented."""
-        admin_obj = IsccDeclarationAdmin(IsccDeclaration, site)
-        assert admin_obj.has_add_permission(admin_request) is False
+        assert declaration_admin.has_add_permission(admin_request) is False
 
 
 class TestEventAdmin:
@@ -292,104 +291,72 @@ class TestEventAdmin:
         assert Event in site._registry
         assert isinstance(site._registry[Event], EventAdmin)
 
-    def test_has_add_permission(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_has_add_permission(self, event_admin, admin_request):
+        # type: (EventAdmin, HttpRequest) -> None
         """Test that adding events is prevented."""
-        admin_obj = EventAdmin(Event, site)
-        assert admin_obj.has_add_permission(admin_request) is False
+        assert event_admin.has_add_permission(admin_request) is False
 
-    def test_has_change_permission_get(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_has_change_permission_get(self, event_admin, admin_request):
+        # type: (EventAdmin, HttpRequest) -> None
         """Test that viewing events is allowed."""
-        admin_obj = EventAdmin(Event, site)
         admin_request.method = "GET"
-        assert admin_obj.has_change_permission(admin_request) is True
+        assert event_admin.has_change_permission(admin_request) is True
 
-    def test_has_change_permission_post(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_has_change_permission_post(self, event_admin, admin_request):
+        # type: (EventAdmin, HttpRequest) -> None
         """Test that editing events is prevented."""
-        admin_obj = EventAdmin(Event, site)
         admin_request.method = "POST"
-        assert admin_obj.has_change_permission(admin_request) is False
+        assert event_admin.has_change_permission(admin_request) is False
 
-    def test_has_delete_permission(self, admin_request):
-        # type: (HttpRequest) -> None
+    def test_has_delete_permission(self, event_admin, admin_request):
+        # type: (EventAdmin, HttpRequest) -> None
         """Test that deleting events is prevented."""
-        admin_obj = EventAdmin(Event, site)
-        assert admin_obj.has_delete_permission(admin_request) is False
-
-    def test_event_type_display_created(self, event):
-        # type: (Event) -> None
-        """Test event type display for CREATED."""
-        admin_obj = EventAdmin(Event, site)
-        event.event_type = 1
-        result = admin_obj.event_type_display(event)
-        assert "CREATED" in result
-        assert "color: green" in result
+        assert event_admin.has_delete_permission(admin_request) is False
 
-    def test_event_type_display_updated(self, event):
-        # type: (Event) -> None
-        """Test event type display for UPDATED."""
-        admin_obj = EventAdmin(Event, site)
-        event.event_type = 2
-        result = admin_obj.event_type_display(event)
-        assert "UPDATED" in result
-        assert "color: blue" in result
-
-    def test_event_type_display_deleted(self, event):
-        # type: (Event) -> None
-        """Test event type display for DELETED."""
-        admin_obj = EventAdmin(Event, site)
-        event.event_type = 3
-        result = admin_obj.event_type_display(event)
-        assert "DELETED" in result
-        assert "color: red" in result
-
-    def test_event_type_display_unknown(self, event):
-        # type: (Event) -> None
-        """Test event type display for unknown type."""
-        admin_obj = EventAdmin(Event, site)
-        event.event_type = 999
-        result = admin_obj.event_type_display(event)
-        assert "UNKNOWN" in result
-        assert "color: black" in result
-
-    def test_iscc_id_display(self, event):
-        # type: (Event) -> None
+    @pytest.mark.parametrize(
+        "event_type,label,color",
+        [(1, "CREATED", "green"), (2, "UPDATED", "blue"), (3, "DELETED", "red"), (999, "UNKNOWN", "black")],
+    )
+    def test_event_type_display(self, event_admin, event, event_type, label, color):
+        # type: (EventAdmin, Event, int, str, str) -> None
+        """Test event type label and color for known and unknown types."""
+        event.event_type = event_type
+        result = event_admin.event_type_display(event)
+        assert label in result
+        assert f"color: {color}" in result
+
+    def test_iscc_id_display(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test ISCC-ID display."""
-        admin_obj = EventAdmin(Event, site)
-        result = admin_obj.iscc_id_display(event)
+        result = event_admin.iscc_id_display(event)
         assert result == "ISCC:KAA777777UJZXHQ2"
 
-    def test_iscc_id_timestamp(self, event):
-        # type: (Event) -> None
+    def test_iscc_id_timestamp(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test ISCC-ID timestamp extraction."""
-        admin_obj = EventAdmin(Event, site)
         # Test with valid ISCC-ID
         event.iscc_id = "ISCC:MEAJU3PC4ICWCTYI"
-        result = admin_obj.iscc_id_timestamp(event)
+        result = event_admin.iscc_id_timestamp(event)
         assert result == "2056-02-02T20:12:57.217556Z"
 
         # Test with None ISCC-ID
         event.iscc_id = None
-        result = admin_obj.iscc_id_timestamp(event)
+        result = event_admin.iscc_id_timestamp(event)
         assert result == "—"
 
-    def test_iscc_note_formatted_valid_json(self, event):
-        # type: (Event) -> None
+    def test_iscc_note_formatted_valid_json(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test JSON formatting for valid data."""
-        admin_obj = EventAdmin(Event, site)
         event.iscc_note = {"key": "value", "nested": {"data": 123}}
-        result = admin_obj.iscc_note_formatted(event)
+        result = event_admin.iscc_note_formatted(event)
         assert "<pre" in result
         assert "background: #f5f5f5" in result
         # HTML-escaped quotes in the output
         assert "&quot;key&quot;: &quot;value&quot;" in result
 
-    def test_iscc_note_formatted_invalid_json(self, event):
-        # type: (Event) -> None
+    def test_iscc_note_formatted_invalid_json(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test JSON formatting fallback for invalid data."""
-        admin_obj = EventAdmin(Event, site)
         # Create a mock object that will raise TypeError when serialized
         mock_obj = Mock()
         mock_obj.__str__ = Mock(return_value="fallback_string")
@@ -401,25 +368,23 @@ class TestEventAdmin:
         original_dumps = iscc_hub.admin.json.dumps
         iscc_hub.admin.json.dumps = Mock(side_effect=TypeError("Cannot serialize"))
 
-        result = admin_obj.iscc_note_formatted(event)
+        result = event_admin.iscc_note_formatted(event)
 
         # Restore original dumps
         iscc_hub.admin.json.dumps = original_dumps
 
         assert result == "fallback_string"
 
-    def test_event_time_iso_with_time(self, event):
-        # type: (Event) -> None
+    def test_event_time_iso_with_time(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test event time ISO formatting with timestamp."""
-        admin_obj = EventAdmin(Event, site)
         event.event_time = datetime(2025, 8, 12, 10, 30, 45, 123456)
-        result = admin_obj.event_time_iso(event)
+        result = event_admin.event_time_iso(event)
         assert result == "2025-08-12T10:30:45.123Z"
 
-    def test_event_time_iso_without_time(self, event):
-        # type: (Event) -> None
+    def test_event_time_iso_without_time(self, event_admin, event):
+        # type: (EventAdmin, Event) -> None
         """Test event time ISO formatting without timestamp."""
-        admin_obj = EventAdmin(Event, site)
         event.event_time = None
-        result = admin_obj.event_time_iso(event)
+        result = event_admin.event_time_iso(event)
         assert result == "—"
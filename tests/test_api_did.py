@@ -20,7 +20,7 @@ def test_did_document_returns_json_structure():
 
     # Verify required DID document fields
     assert "id" in did_doc
-    assert did_doc["id"].startswith("did:web:")
+    assert did_doc["id"] == "did:web:testserver"
     assert "verificationMethod" in did_doc
     assert isinstance(did_doc["verificationMethod"], list)
     assert len(did_doc["verificationMethod"]) > 0
@@ -1,9 +1,12 @@
 """Schemathesis property-based API testing against OpenAPI specification."""
 
+import os
 import pathlib
 
 import pytest
 import schemathesis
+from hypothesis import HealthCheck, settings
+from werkzeug import Client
 
 from iscc_hub.wsgi import application
 
@@ -14,12 +17,27 @@ OPENAPI_PATH = HERE.parent / "iscc_hub" / "static" / "openapi.yaml"
 # Load schema from YAML file for WSGI testing
 schema = schemathesis.openapi.from_path(OPENAPI_PATH.as_posix())
 
+# Examples per API operation, raise locally for deeper fuzzing
+MAX_EXAMPLES = int(os.environ.get("ISCC_HUB_FUZZ_MAX_EXAMPLES", "50"))
+
+
+@pytest.fixture(scope="session")
+def wsgi_client():
+    # type: () -> Client
+    """Return one WSGI test client shared by all generated cases."""
+    return Client(application)
+
 
 @pytest.mark.slow
 @schema.parametrize()
+@settings(
+    max_examples=MAX_EXAMPLES,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture],
+)
 @pytest.mark.django_db
-def test_api_fuzz(case):
-    # type: (schemathesis.Case) -> None
+def test_api_fuzz(case, wsgi_client):
+    # type: (schemathesis.Case, Client) -> None
     """
     Fuzz test API endpoints against the OpenAPI specification.
 
@@ -32,7 +50,7 @@ def test_api_fuzz(case):
     malformed requests.
     """
     # Test against the WSGI application
-    response = case.call(app=application)
+    response = case.call(app=application, session=wsgi_client)
 
     # Accept documented error responses
     if response.status_code in [400, 401, 422]:
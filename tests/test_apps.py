@@ -10,49 +10,36 @@ from django.test import override_settings
 from iscc_hub.apps import IsccHubConfig
 
 
-def test_app_config_basic_attributes():
-    """Test basic app configuration attributes."""
-    # Get the actual registered app config
-    app_config = apps.get_app_config("iscc_hub")
+@pytest.fixture(scope="module")
+def app_config():
+    # type: () -> IsccHubConfig
+    """Return the registered iscc_hub app config."""
+    return apps.get_app_config("iscc_hub")
+
 
+def test_app_config_basic_attributes(app_config):
+    """Test basic app configuration attributes."""
     assert app_config.name == "iscc_hub"
     assert app_config.verbose_name == "ISCC-HUB"
     assert app_config.default_auto_field == "django.db.models.BigAutoField"
 
 
-def test_app_config_is_registered():
+def test_app_config_is_registered(app_config):
     """Test that the app is properly registered with Django."""
     assert "iscc_hub" in apps.all_models
-    app_config = apps.get_app_config("iscc_hub")
     assert isinstance(app_config, IsccHubConfig)
 
 
-@override_settings(ISCC_HUB_ID=42)
-def test_validate_hub_id_valid():
-    """Test validation with a valid node ID."""
-    app_config = apps.get_app_config("iscc_hub")
-    # Should not raise any exception
-    app_config.validate_hub_id()
-
-
-@override_settings(ISCC_HUB_ID=0)
-def test_validate_hub_id_minimum():
-    """Test validation with minimum valid node ID."""
-    app_config = apps.get_app_config("iscc_hub")
-    app_config.validate_hub_id()
-
-
-@override_settings(ISCC_HUB_ID=4095)
-def test_validate_hub_id_maximum():
-    """Test validation with maximum valid node ID."""
-    app_config = apps.get_app_config("iscc_hub")
-    app_config.validate_hub_id()
+@pytest.mark.parametrize("hub_id", [42, 0, 4095])
+def test_validate_hub_id_valid(app_config, hub_id):
+    """Test validation with valid node IDs including the 12-bit range limits."""
+    with override_settings(ISCC_HUB_ID=hub_id):
+        # Should not raise any exception
+        app_config.validate_hub_id()
 
 
-def test_validate_hub_id_missing():
+def test_validate_hub_id_missing(app_config):
     """Test validation when ISCC_HUB_ID is not configured."""
-    app_config = apps.get_app_config("iscc_hub")
-
     # Mock settings to simulate missing ISCC_HUB_ID
     with patch("iscc_hub.apps.settings") as mock_settings:
         mock_settings.ISCC_HUB_ID = None
@@ -61,45 +48,30 @@ def test_validate_hub_id_missing():
             app_config.validate_hub_id()
 
 
-@override_settings(ISCC_HUB_ID="not_an_int")
-def test_validate_hub_id_wrong_type():
-    """Test validation when ISCC_HUB_ID is not an integer."""
-    app_config = apps.get_app_config("iscc_hub")
-
-    with pytest.raises(ImproperlyConfigured, match="ISCC_HUB_ID must be an integer"):
-        app_config.validate_hub_id()
-
-
-@override_settings(ISCC_HUB_ID=-1)
-def test_validate_hub_id_negative():
-    """Test validation with negative node ID."""
-    app_config = apps.get_app_config("iscc_hub")
-
-    with pytest.raises(ImproperlyConfigured, match="ISCC_HUB_ID must be between 0 and 4095"):
-        app_config.validate_hub_id()
-
-
-@override_settings(ISCC_HUB_ID=4096)
-def test_validate_hub_id_too_large():
-    """Test validation with node ID exceeding 12-bit range."""
-    app_config = apps.get_app_config("iscc_hub")
-
-    with pytest.raises(ImproperlyConfigured, match="ISCC_HUB_ID must be between 0 and 4095"):
-        app_config.validate_hub_id()
+@pytest.mark.parametrize(
+    "hub_id,match",
+    [
+        ("not_an_int", "ISCC_HUB_ID must be an integer"),
+        (-1, "ISCC_HUB_ID must be between 0 and 4095"),
+        (4096, "ISCC_HUB_ID must be between 0 and 4095"),
+    ],
+)
+def test_validate_hub_id_invalid(app_config, hub_id, match):
+    """Test validation with wrong types and node IDs outside the 12-bit range."""
+    with override_settings(ISCC_HUB_ID=hub_id):
+        with pytest.raises(ImproperlyConfigured, match=match):
+            app_config.validate_hub_id()
 
 
 @override_settings(ISCC_HUB_ID=42)
-def test_ready_method():
+def test_ready_method(app_config):
     """Test the ready() method initializes properly."""
-    app_config = apps.get_app_config("iscc_hub")
     # Should not raise any exception
     app_config.ready()
 
 
-def test_validate_hub_id_none_value():
+def test_validate_hub_id_none_value(app_config):
     """Test validation when ISCC_HUB_ID is explicitly None."""
-    app_config = apps.get_app_config("iscc_hub")
-
     # Mock getattr to return None for ISCC_HUB_ID
     with patch("iscc_hub.apps.getattr") as mock_getattr:
         mock_getattr.return_value = None
@@ -1,6 +1,9 @@
 """Tests for context processors."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.http import HttpRequest
 
 from iscc_hub.context import hub_context
 
@@ -8,9 +11,9 @@ from iscc_hub.context import hub_context
 def test_hub_context_returns_hub_id():
     # type: () -> None
     """Test that hub_context returns the correct hub ID from settings."""
-    request = MagicMock()
+    request = HttpRequest()
 
-    with patch("iscc_hub.context.settings", ISCC_HUB_ID=42, DEBUG=True):
+    with patch("iscc_hub.context.settings", SimpleNamespace(ISCC_HUB_ID=42, DEBUG=True)):
         result = hub_context(request)
 
         assert result["hub_id"] == 42
@@ -20,12 +23,10 @@ def test_hub_context_returns_hub_id():
 def test_hub_context_with_missing_settings():
     # type: () -> None
     """Test that hub_context handles missing settings gracefully."""
-    request = MagicMock()
-
-    # Mock settings without the ISCC_HUB_ID and DEBUG attributes
-    mock_settings = MagicMock(spec=[])
+    request = HttpRequest()
 
-    with patch("iscc_hub.context.settings", mock_settings):
+    # Settings without the ISCC_HUB_ID and DEBUG attributes
+    with patch("iscc_hub.context.settings", SimpleNamespace()):
         result = hub_context(request)
 
         assert result["hub_id"] == 0
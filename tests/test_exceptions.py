@@ -15,195 +15,133 @@ from iscc_hub.exceptions import (
 )
 
 
-def test_validation_error_basic():
-    # type: () -> None
-    """Test basic ValidationError with message only."""
-    error = ValidationError("Something went wrong")
-    assert str(error) == "Something went wrong"
-    assert error.message == "Something went wrong"
-    assert error.code == "validation_failed"
-    assert error.field is None
-
-    response = error.to_error_response()
-    assert response == {"error": {"message": "Something went wrong", "code": "validation_failed"}}
-
-
-def test_validation_error_with_code():
-    # type: () -> None
-    """Test ValidationError with custom code."""
-    error = ValidationError("Custom error", code="custom_code")
-    assert error.code == "custom_code"
-
-    response = error.to_error_response()
-    assert response == {"error": {"message": "Custom error", "code": "custom_code"}}
-
-
-def test_validation_error_with_field():
-    # type: () -> None
-    """Test ValidationError with field information."""
-    error = ValidationError("Field error", code="field_error", field="test_field")
-    assert error.field == "test_field"
-
-    response = error.to_error_response()
-    assert response == {"error": {"message": "Field error", "code": "field_error", "field": "test_field"}}
-
-
-def test_field_validation_error():
-    # type: () -> None
-    """Test FieldValidationError."""
-    error = FieldValidationError("username", "Username is required", "missing_field")
-    assert error.field == "username"
-    assert error.message == "Username is required"
-    assert error.code == "missing_field"
-
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Username is required", "code": "missing_field", "field": "username"}
-    }
-
-
-def test_iscc_code_error():
-    # type: () -> None
-    """Test IsccCodeError with automatic field and code."""
-    error = IsccCodeError("Invalid ISCC format")
-    assert error.field == "iscc_code"
-    assert error.code == "invalid_iscc"
-    assert error.message == "Invalid ISCC format"
-
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Invalid ISCC format", "code": "invalid_iscc", "field": "iscc_code"}
-    }
-
-
-def test_timestamp_error_format():
-    # type: () -> None
-    """Test TimestampError for format issues."""
-    error = TimestampError("Invalid timestamp format")
-    assert error.field == "timestamp"
-    assert error.code == "invalid_format"
-
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Invalid timestamp format", "code": "invalid_format", "field": "timestamp"}
-    }
-
-
-def test_timestamp_error_out_of_range():
-    # type: () -> None
-    """Test TimestampError for out of range timestamp."""
-    error = TimestampError("Timestamp too old", out_of_range=True)
-    assert error.field == "timestamp"
-    assert error.code == "timestamp_out_of_range"
-
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Timestamp too old", "code": "timestamp_out_of_range", "field": "timestamp"}
-    }
-
-
-def test_nonce_error_format():
-    # type: () -> None
-    """Test NonceError for format issues."""
-    error = NonceError("Invalid nonce format")
-    assert error.field == "nonce"
-    assert error.code == "invalid_format"
-
-    response = error.to_error_response()
-    assert response["error"]["code"] == "invalid_format"
-
-
-def test_nonce_error_reuse():
-    # type: () -> None
-    """Test NonceError for nonce reuse."""
-    error = NonceError("Nonce already used: 000faa3f18c7b9407a48536a9b00c4cb", is_reuse=True)
-    assert error.code == "nonce_reuse"
-
-    response = error.to_error_response()
-    assert response["error"]["code"] == "nonce_reuse"
-    assert response["error"]["field"] == "nonce"
-
-
-def test_nonce_error_mismatch():
-    # type: () -> None
-    """Test NonceError for hub ID mismatch."""
-    error = NonceError("Hub ID mismatch", is_mismatch=True)
-    assert error.code == "nonce_mismatch"
-
-    response = error.to_error_response()
-    assert response["error"]["code"] == "nonce_mismatch"
-
-
-def test_signature_error():
-    # type: () -> None
-    """Test SignatureError."""
-    error = SignatureError("Invalid signature")
-    assert error.code == "invalid_signature"
-    assert error.field is None  # Signature errors don't have a specific field
-
-    response = error.to_error_response()
-    assert response == {"error": {"message": "Invalid signature", "code": "invalid_signature"}}
-
-
-def test_hash_error_format():
-    # type: () -> None
-    """Test HashError for format issues."""
-    error = HashError("datahash", "Invalid hash format")
-    assert error.field == "datahash"
-    assert error.code == "invalid_format"
-
-    response = error.to_error_response()
-    assert response["error"]["field"] == "datahash"
-    assert response["error"]["code"] == "invalid_format"
-
-
-def test_hash_error_duplicate():
-    # type: () -> None
-    """Test HashError for duplicate datahash."""
-    error = HashError("datahash", "Datahash already exists", is_duplicate=True)
-    assert error.field == "datahash"
-    assert error.code == "duplicate_datahash"
-
-    response = error.to_error_response()
-    assert response["error"]["code"] == "duplicate_datahash"
-
-
-def test_hash_error_metahash():
-    # type: () -> None
-    """Test HashError for metahash (not duplicate)."""
-    error = HashError("metahash", "Invalid metahash", is_duplicate=True)
-    assert error.field == "metahash"
-    assert error.code == "invalid_format"  # metahash doesn't get duplicate_datahash code
-
-    response = error.to_error_response()
-    assert response["error"]["field"] == "metahash"
-    assert response["error"]["code"] == "invalid_format"
-
-
-def test_length_error():
-    # type: () -> None
-    """Test LengthError."""
-    error = LengthError("nonce", "Nonce must be 32 characters")
-    assert error.field == "nonce"
-    assert error.code == "invalid_length"
-
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Nonce must be 32 characters", "code": "invalid_length", "field": "nonce"}
-    }
-
-
-def test_hex_format_error():
-    # type: () -> None
-    """Test HexFormatError."""
-    error = HexFormatError("datahash", "Must be lowercase hex")
-    assert error.field == "datahash"
-    assert error.code == "invalid_hex"
+@pytest.mark.parametrize(
+    "error,message,code,field",
+    [
+        pytest.param(
+            ValidationError("Something went wrong"),
+            "Something went wrong",
+            "validation_failed",
+            None,
+            id="validation_basic",
+        ),
+        pytest.param(
+            ValidationError("Custom error", code="custom_code"),
+            "Custom error",
+            "custom_code",
+            None,
+            id="validation_with_code",
+        ),
+        pytest.param(
+            ValidationError("Field error", code="field_error", field="test_field"),
+            "Field error",
+            "field_error",
+            "test_field",
+            id="validation_with_field",
+        ),
+        pytest.param(
+            FieldValidationError("username", "Username is required", "missing_field"),
+            "Username is required",
+            "missing_field",
+            "username",
+            id="field_validation",
+        ),
+        pytest.param(
+            IsccCodeError("Invalid ISCC format"),
+            "Invalid ISCC format",
+            "invalid_iscc",
+            "iscc_code",
+            id="iscc_code",
+        ),
+        pytest.param(
+            TimestampError("Invalid timestamp format"),
+            "Invalid timestamp format",
+            "invalid_format",
+            "timestamp",
+            id="timestamp_format",
+        ),
+        pytest.param(
+            TimestampError("Timestamp too old", out_of_range=True),
+            "Timestamp too old",
+            "timestamp_out_of_range",
+            "timestamp",
+            id="timestamp_out_of_range",
+        ),
+        pytest.param(
+            NonceError("Invalid nonce format"),
+            "Invalid nonce format",
+            "invalid_format",
+            "nonce",
+            id="nonce_format",
+        ),
+        pytest.param(
+            NonceError("Nonce already used: 000faa3f18c7b9407a48536a9b00c4cb", is_reuse=True),
+            "Nonce already used: 000faa3f18c7b9407a48536a9b00c4cb",
+            "nonce_reuse",
+            "nonce",
+            id="nonce_reuse",
+        ),
+        pytest.param(
+            NonceError("Hub ID mismatch", is_mismatch=True),
+            "Hub ID mismatch",
+            "nonce_mismatch",
+            "nonce",
+            id="nonce_mismatch",
+        ),
+        # Signature errors don't have a specific field
+        pytest.param(
+            SignatureError("Invalid signature"), "Invalid signature", "invalid_signature", None, id="signature"
+        ),
+        pytest.param(
+            HashError("datahash", "Invalid hash format"),
+            "Invalid hash format",
+            "invalid_format",
+            "datahash",
+            id="hash_format",
+        ),
+        pytest.param(
+            HashError("datahash", "Datahash already exists", is_duplicate=True),
+            "Datahash already exists",
+            "duplicate_datahash",
+            "datahash",
+            id="hash_duplicate",
+        ),
+        # metahash doesn't get the duplicate_datahash code
+        pytest.param(
+            HashError("metahash", "Invalid metahash", is_duplicate=True),
+            "Invalid metahash",
+            "invalid_format",
+            "metahash",
+            id="hash_metahash",
+        ),
+        pytest.param(
+            LengthError("nonce", "Nonce must be 32 characters"),
+            "Nonce must be 32 characters",
+            "invalid_length",
+            "nonce",
+            id="length",
+        ),
+        pytest.param(
+            HexFormatError("datahash", "Must be lowercase hex"),
+            "Must be lowercase hex",
+            "invalid_hex",
+            "datahash",
+            id="hex",
+        ),
+    ],
+)
+def test_error_attributes_and_response(error, message, code, field):
+    # type: (ValidationError, str, str, str|None) -> None
+    """Test message, code and field of each error and its ErrorResponse payload."""
+    assert str(error) == message
+    assert error.message == message
+    assert error.code == code
+    assert error.field == field
 
-    response = error.to_error_response()
-    assert response == {
-        "error": {"message": "Must be lowercase hex", "code": "invalid_hex", "field": "datahash"}
-    }
+    expected = {"message": message, "code": code}
+    if field is not None:
+        expected["field"] = field
+    assert error.to_error_response() == {"error": expected}
 
 
 def test_exception_inheritance():
@@ -219,35 +157,36 @@ def test_exception_inheritance():
     assert issubclass(HexFormatError, FieldValidationError)
 
 
-def test_error_response_conforms_to_schema():
-    # type: () -> None
-    """Test that error responses conform to ErrorResponse schema."""
-    # Test various error types to ensure they all produce valid responses
-    errors = [
-        ValidationError("Generic error"),
-        FieldValidationError("field", "Field error", "field_code"),
-        IsccCodeError("Invalid ISCC"),
-        TimestampError("Bad time", out_of_range=True),
-        NonceError("Bad nonce", is_reuse=True),
-        SignatureError("Bad sig"),
-        HashError("datahash", "Bad hash"),
-        LengthError("field", "Too long"),
-        HexFormatError("field", "Not hex"),
-    ]
+# One instance per error class and variant for the ErrorResponse schema check
+ERROR_INSTANCES = [
+    ValidationError("Generic error"),
+    FieldValidationError("field", "Field error", "field_code"),
+    IsccCodeError("Invalid ISCC"),
+    TimestampError("Bad time", out_of_range=True),
+    NonceError("Bad nonce", is_reuse=True),
+    SignatureError("Bad sig"),
+    HashError("datahash", "Bad hash"),
+    LengthError("field", "Too long"),
+    HexFormatError("field", "Not hex"),
+]
+
 
-    for error in errors:
-        response = error.to_error_response()
+@pytest.mark.parametrize("error", ERROR_INSTANCES, ids=lambda error: type(error).__name__)
+def test_error_response_conforms_to_schema(error):
+    # type: (ValidationError) -> None
+    """Test that error responses conform to ErrorResponse schema."""
+    response = error.to_error_response()
 
-        # Check structure matches ErrorResponse schema
-        assert "error" in response
-        assert isinstance(response["error"], dict)
+    # Check structure matches ErrorResponse schema
+    assert "error" in response
+    assert isinstance(response["error"], dict)
 
-        error_detail = response["error"]
-        assert "message" in error_detail
-        assert isinstance(error_detail["message"], str)
-        assert "code" in error_detail
-        assert isinstance(error_detail["code"], str)
+    error_detail = response["error"]
+    assert "message" in error_detail
+    assert isinstance(error_detail["message"], str)
+    assert "code" in error_detail
+    assert isinstance(error_detail["code"], str)
 
-        # Field is optional but must be string if present
-        if "field" in error_detail:
-            assert isinstance(error_detail["field"], str)
+    # Field is optional but must be string if present
+    if "field" in error_detail:
+        assert isinstance(error_detail["field"], str)
@@ -2,14 +2,17 @@
 Tests for Django models.
 """
 
+import time
+
 import iscc_crypto as icr
 import pytest
+from django.db import IntegrityError, transaction
 
 from iscc_hub.models import Event, IsccDeclaration
-from tests.conftest import generate_test_iscc_id
+from tests.conftest import create_test_declarations, create_test_events, generate_test_iscc_id
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_event_model_creation(minimal_iscc_note):
     # type: (dict) -> None
     """
@@ -24,9 +27,9 @@ def test_event_model_creation(minimal_iscc_note):
     assert event.event_time is not None
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
-def test_event_gapless_sequence(example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, object, dict) -> None
+@pytest.mark.django_db
+def test_event_gapless_sequence(example_timestamp, example_keypair, example_iscc_data, fast_sign):
+    # type: (str, object, dict, None) -> None
     """
     Test that Event model maintains gapless sequence numbers.
     """
@@ -66,9 +69,9 @@ def test_event_gapless_sequence(example_timestamp, example_keypair, example_iscc
     assert events[2].seq == 3
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
-def test_event_types(example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, object, dict) -> None
+@pytest.mark.django_db
+def test_event_types(example_timestamp, example_keypair, example_iscc_data, fast_sign):
+    # type: (str, object, dict, None) -> None
     """
     Test different event types.
     """
@@ -110,9 +113,9 @@ def test_event_types(example_timestamp, example_keypair, example_iscc_data):
     assert Event.EventType.DELETED == 3
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
-def test_event_str_representation(example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, object, dict) -> None
+@pytest.mark.django_db
+def test_event_str_representation(example_timestamp, example_keypair, example_iscc_data, fast_sign):
+    # type: (str, object, dict, None) -> None
     """
     Test Event model string representation.
     """
@@ -152,9 +155,9 @@ def test_event_str_representation(example_timestamp, example_keypair, example_is
     assert str(event3) == f"Event #3: Deleted {test_id3}"
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
-def test_event_non_unique_iscc_id(example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, object, dict) -> None
+@pytest.mark.django_db
+def test_event_non_unique_iscc_id(example_timestamp, example_keypair, example_iscc_data, fast_sign):
+    # type: (str, object, dict, None) -> None
     """
     Test that multiple events can have the same ISCC-ID (for updates).
     """
@@ -208,9 +211,9 @@ def test_event_non_unique_iscc_id(example_timestamp, example_keypair, example_is
     assert events[2].event_type == Event.EventType.DELETED
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
-def test_event_indexes(example_timestamp, example_keypair, example_iscc_data):
-    # type: (str, object, dict) -> None
+@pytest.mark.django_db
+def test_event_indexes(example_timestamp, example_keypair, example_iscc_data, fast_sign):
+    # type: (str, object, dict, None) -> None
     """
     Test that indexes are properly applied.
     """
@@ -256,7 +259,6 @@ def test_event_indexes(example_timestamp, example_keypair, example_iscc_data):
     # Events should be ordered by sequence
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
 def test_event_model_meta():
     # type: () -> None
     """
@@ -273,7 +275,6 @@ def test_event_model_meta():
     assert Event._meta.verbose_name_plural == "Events"
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
 def test_event_type_choices():
     # type: () -> None
     """
@@ -296,7 +297,7 @@ def test_event_type_choices():
     assert Event.EventType.DELETED.value == 3
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_event_with_full_iscc_note(full_iscc_note):
     # type: (dict) -> None
     """
@@ -316,7 +317,7 @@ def test_event_with_full_iscc_note(full_iscc_note):
 # IsccDeclaration Model Tests
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_creation():
     # type: () -> None
     """
@@ -340,7 +341,7 @@ def test_iscc_declaration_creation():
     assert declaration.updated_at is not None
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_with_optional_fields():
     # type: () -> None
     """
@@ -361,7 +362,7 @@ def test_iscc_declaration_with_optional_fields():
     assert declaration.metahash == "1e20abcd1234567890abcdef1234567890abcdef1234567890abcdef12345678"
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_str_representation():
     # type: () -> None
     """
@@ -392,7 +393,7 @@ def test_iscc_declaration_str_representation():
     assert str(deleted_declaration) == f"{generate_test_iscc_id(seq=61)} (deleted)"
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_unique_constraints():
     # type: () -> None
     """
@@ -409,9 +410,7 @@ def test_iscc_declaration_unique_constraints():
     )
 
     # Test iscc_id uniqueness (primary key)
-    from django.db import IntegrityError
-
-    with pytest.raises(IntegrityError):
+    with pytest.raises(IntegrityError), transaction.atomic():
         IsccDeclaration.objects.create(
             iscc_id=generate_test_iscc_id(seq=70),  # Duplicate
             event_seq=2,
@@ -422,7 +421,7 @@ def test_iscc_declaration_unique_constraints():
         )
 
     # Test event_seq uniqueness
-    with pytest.raises(IntegrityError):
+    with pytest.raises(IntegrityError), transaction.atomic():
         IsccDeclaration.objects.create(
             iscc_id=generate_test_iscc_id(seq=71),
             event_seq=1,  # Duplicate
@@ -433,7 +432,7 @@ def test_iscc_declaration_unique_constraints():
         )
 
     # Test nonce uniqueness
-    with pytest.raises(IntegrityError):
+    with pytest.raises(IntegrityError), transaction.atomic():
         IsccDeclaration.objects.create(
             iscc_id=generate_test_iscc_id(seq=72),
             event_seq=3,
@@ -444,7 +443,7 @@ def test_iscc_declaration_unique_constraints():
         )
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_soft_delete():
     # type: () -> None
     """
@@ -476,7 +475,7 @@ def test_iscc_declaration_soft_delete():
     assert generate_test_iscc_id(seq=80) not in [d.iscc_id for d in active_declarations]
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_redacted_field():
     # type: () -> None
     """
@@ -513,7 +512,7 @@ def test_iscc_declaration_redacted_field():
     assert generate_test_iscc_id(seq=81) in [d.iscc_id for d in redacted]
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_redacted_and_deleted_combination():
     # type: () -> None
     """
@@ -560,7 +559,7 @@ def test_iscc_declaration_redacted_and_deleted_combination():
     assert generate_test_iscc_id(seq=82) in [d.iscc_id for d in both]
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_indexes():
     # type: () -> None
     """
@@ -604,7 +603,23 @@ def test_iscc_declaration_indexes():
     assert results.count() == 1
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
+def test_bulk_test_factories():
+    # type: () -> None
+    """
+    Test that the bulk factories create rows with consecutive unique values.
+    """
+    declarations = create_test_declarations(3, start_seq=10, actor="bulk-actor")
+    events = create_test_events(3)
+
+    assert IsccDeclaration.objects.filter(actor="bulk-actor").count() == 3
+    assert [d.event_seq for d in declarations] == [10, 11, 12]
+    assert len({d.nonce for d in declarations}) == 3
+    assert list(Event.objects.values_list("seq", flat=True).order_by("seq")) == [1, 2, 3]
+    assert [e.iscc_id for e in events] == [generate_test_iscc_id(seq=seq) for seq in (1, 2, 3)]
+
+
+@pytest.mark.django_db
 def test_iscc_declaration_update():
     # type: () -> None
     """
@@ -624,8 +639,6 @@ def test_iscc_declaration_update():
     original_updated_at = declaration.updated_at
 
     # Add small delay to ensure timestamp changes (Windows timing precision issue)
-    import time
-
     time.sleep(0.001)
 
     # Simulate full replacement update
@@ -646,7 +659,7 @@ def test_iscc_declaration_update():
     assert declaration.updated_at > original_updated_at  # auto_now should update
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_model_meta():
     # type: () -> None
     """
@@ -679,7 +692,7 @@ def test_iscc_declaration_model_meta():
     assert ["event_seq", "deleted"] in index_fields
 
 
-@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.django_db
 def test_iscc_declaration_duplicate_content_allowed():
     # type: () -> None
     """
@@ -98,7 +98,7 @@ def test_missing_required_fields():
 
 @pytest.mark.slow
 @pytest.mark.django_db(transaction=True)
-def test_performance_benchmark():
+def test_performance_benchmark(fast_sign):
     """Performance benchmark for sequencing operations."""
     num_operations = 100
     start_time = time.perf_counter()
@@ -153,7 +153,7 @@ def test_hub_id_encoding(full_iscc_note):
 
 
 @pytest.mark.django_db(transaction=True)
-def test_timestamp_precision():
+def test_timestamp_precision(fast_sign):
     """Test that timestamps have microsecond precision."""
     notes = []
     for i in range(5):
@@ -211,7 +211,7 @@ def test_nonce_error_inheritance():
 
 
 @pytest.mark.django_db(transaction=True)
-def test_nonce_conflict_detection():
+def test_nonce_conflict_detection(fast_sign):
     """Test that duplicate nonces are rejected."""
     # Create and sequence first note with specific nonce
     nonce = "00100123456789abcdef0123456789ab"
@@ -253,7 +253,7 @@ def test_nonce_conflict_detection():
 
 
 @pytest.mark.django_db(transaction=True)
-def test_invalid_hub_id(monkeypatch, full_iscc_note):
+def test_invalid_hub_id(monkeypatch, full_iscc_note, fast_sign):
     """Test that invalid hub_id raises SequencerError."""
     # Save original value
     original_hub_id = settings.ISCC_HUB_ID
@@ -286,7 +286,7 @@ def test_invalid_hub_id(monkeypatch, full_iscc_note):
 
 
 @pytest.mark.django_db(transaction=True)
-def test_monotonic_timestamp_edge_case(monkeypatch, full_iscc_note):
+def test_monotonic_timestamp_edge_case(monkeypatch, full_iscc_note, fast_sign):
     """Test timestamp monotonicity when system clock goes backward."""
     # First, insert a normal note
     seq1, iscc_id1 = sequence_iscc_note(full_iscc_note)
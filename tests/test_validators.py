@@ -1,7 +1,11 @@
 """Comprehensive tests for iscc_hub.validators module."""
 
 from datetime import UTC, datetime, timedelta
+from io import BytesIO
+from unittest.mock import patch
 
+import iscc_core as ic
+import iscc_crypto as icr
 import pytest
 
 from iscc_hub import validators
@@ -653,8 +657,6 @@ def test_datahash_to_instance_code():
     assert len(instance_code) > 5
 
     # Verify it's an Instance-Code by decoding
-    import iscc_core as ic
-
     decoded = ic.iscc_decode(instance_code)
     assert decoded[0] == ic.MT.INSTANCE
 
@@ -720,14 +722,12 @@ def test_validate_units_reconstruction_generic_exception():
     # type: () -> None
     """Test generic exception handler in validate_units_reconstruction."""
     # Mock a generic exception by passing an object that will fail inside gen_iscc_code
-    import unittest.mock as mock
-
     units = ["ISCC:AADZH265WE3KJOSR5K67QJEF5JHLF2REJJYVI4ZYKJ727JU2ZX2AHNQ"]
     datahash = "1e208021a144e1ce8fd4ecb2c7660d712b0e6818926bf2e3bb4930d54b5b23ed304d"
     iscc_code = "ISCC:KACT46A6S3L5XTH3O2UXRHPKZOTRV2QZ2UDAEVWVWOACDIKE4HHI7VA"
 
     # Patch gen_iscc_code to raise a non-ValueError exception
-    with mock.patch("iscc_hub.validators.ic.gen_iscc_code", side_effect=RuntimeError("Unexpected error")):
+    with patch("iscc_hub.validators.ic.gen_iscc_code", side_effect=RuntimeError("Unexpected error")):
         with pytest.raises(ValueError, match="ISCC code reconstruction failed: units and datahash"):
             validators.validate_units_reconstruction(units, datahash, iscc_code)
 
@@ -735,10 +735,6 @@ def test_validate_units_reconstruction_generic_exception():
 def test_validate_datahash_match_wide_iscc():
     # type: () -> None
     """Test datahash matching for WIDE subtype ISCC (128-bit comparison)."""
-    from io import BytesIO
-
-    import iscc_core as ic
-
     # Create test content
     content = b"Test content for WIDE ISCC generation"
 
@@ -767,13 +763,11 @@ def test_validate_datahash_match_invalid_iscc_error():
     """Test validate_datahash_match converts iscc_core errors."""
     # Use an invalid ISCC that will cause an error during decoding
     # This tests line 475 where iscc_core errors are converted
-    import unittest.mock as mock
-
     iscc_code = "ISCC:KACT46A6S3L5XTH3O2UXRHPKZOTRV2QZ2UDAEVWVWOACDIKE4HHI7VA"
     datahash = "1e208021a144e1ce8fd4ecb2c7660d712b0e6818926bf2e3bb4930d54b5b23ed304d"
 
     # Mock iscc_decode to raise a ValueError that's not our custom message
-    with mock.patch("iscc_hub.validators.ic.iscc_decode", side_effect=ValueError("Some other error")):
+    with patch("iscc_hub.validators.ic.iscc_decode", side_effect=ValueError("Some other error")):
         with pytest.raises(ValueError, match="Invalid ISCC code: Some other error"):
             validators.validate_datahash_match(iscc_code, datahash)
 
@@ -986,8 +980,6 @@ def test_validate_iscc_note_full_validation(
     # type: (str, str, Any, dict) -> None
     """Test validate_iscc_note with full validation."""
     # Create a note with current timestamp for tolerance testing
-    import iscc_crypto as icr
-
     minimal_note = {
         "iscc_code": example_iscc_data["iscc"],
         "datahash": example_iscc_data["datahash"],
@@ -1045,8 +1037,6 @@ def test_validate_iscc_note_missing_field():
 def test_validate_iscc_note_skip_timestamp(example_nonce, example_keypair, example_iscc_data):
     # type: (str, Any, dict) -> None
     """Test validate_iscc_note skipping timestamp tolerance check."""
-    import iscc_crypto as icr
-
     # Create a note with an old timestamp
     old_note = {
         "iscc_code": example_iscc_data["iscc"],
@@ -1158,8 +1148,6 @@ def test_verify_signature_cryptographically_valid_with_keypair(
 ):
     # type: () -> None
     """Test successful cryptographic signature verification."""
-    import iscc_crypto as icr
-
     # Create and sign a valid note
     note = {
         "iscc_code": example_iscc_data["iscc"],
@@ -1196,8 +1184,6 @@ def test_validate_units_exceeds_max_size(example_iscc_data):
 def test_verify_signature_cryptographically_exception():
     # type: () -> None
     """Test that exceptions during signature verification are handled properly."""
-    from unittest.mock import patch
-
     test_data = {
         "iscc_code": "ISCC:KACWN77F73NA44D6EUG3S3QNJIL2BPPQFMW6ZX6CZNOKPAK23S2IJ2I",
         "signature": {"version": "ISCC-SIG v1.0", "proof": "zInvalidProof", "pubkey": "zInvalidPubkey"},